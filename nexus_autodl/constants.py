@@ -5,13 +5,30 @@ Constants used throughout the Nexus AutoDL application.
 class AppConstants:
     VERSION = "v0.6.3"
     CONFIG_FILE = "config.json"
+    CONFIG_SAVE_DELAY = 500
     CLICK_TOLERANCE = 3
     MIN_CAPTURE_SIZE = 10
     TRANSPARENT_COLOR = "#010203"
     CACHE_SIZE = 50
-    SUPPORTED_IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.gif'}
+    TEMPLATE_REVALIDATE_INTERVAL = 1.0
+    TEMPLATE_MISSING_TTL = 5.0
+    TEMPLATE_CACHE_FILE = ".templates_cache.npz"
+    TEMPLATE_CACHE_FLUSH_DELAY = 2000
+    FORCE_GC_ON_CLEAR = False
+    SUPPORTED_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.gif'})
     TOOLTIP_DELAY = 400
+    PREVIEW_CACHE_SIZE = 16
+    PREVIEW_POLL_INTERVAL = 30
+    HOTKEY_DEBOUNCE_SECONDS = 0.25
     FEEDBACK_WINDOW_DELAY = 100
+    MATCH_QUEUE_POLL_INTERVAL = 30
+    MATCH_ROI_MARGIN = 40
+    MATCH_ROI_SCALE = 0.5
+    MATCH_PYRAMID_LEVELS = 2
+    MATCH_PYRAMID_MIN_SIZE = 12
+    MATCH_PYRAMID_SLACK = 0.2
     LOG_WINDOW_SIZE = "800x400"
+    LOG_FLUSH_INTERVAL = 50
+    LOG_BUFFER_SIZE = 2000
     PROFILE_MANAGER_SIZE = "650x500"
-    INVALID_FILENAME_CHARS = {'/', '\\', ':', '*', '?', '"', '<', '>', '|'}
+    INVALID_FILENAME_CHARS = frozenset('/\\:*?"<>|')
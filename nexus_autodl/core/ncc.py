@@ -0,0 +1,58 @@
+"""
+Numba-compiled template matching, used when OpenCV is not installed.
+"""
+
+import math
+from typing import Tuple
+
+import numba
+import numpy as np
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _correlate(screen, template, window_sums, window_sq_sums, template_norm, result):
+    rows, cols = result.shape
+    template_height, template_width = template.shape
+    count = template_height * template_width
+
+    for y in numba.prange(rows):
+        for x in range(cols):
+            acc = 0.0
+            for i in range(template_height):
+                for j in range(template_width):
+                    acc += screen[y + i, x + j] * template[i, j]
+
+            window_sum = window_sums[y, x]
+            variance = window_sq_sums[y, x] - window_sum * window_sum / count
+            denominator = variance * template_norm
+            result[y, x] = acc / math.sqrt(denominator) if denominator > 1e-6 else 0.0
+
+def _window_sums(image, height: int, width: int):
+    # Integral image with a zero border, so every window sum is four lookups.
+    integral = np.zeros((image.shape[0] + 1, image.shape[1] + 1), dtype=np.float64)
+    np.cumsum(np.cumsum(image, axis=0, dtype=np.float64), axis=1, out=integral[1:, 1:])
+    return (integral[height:, width:] - integral[:-height, width:]
+            - integral[height:, :-width] + integral[:-height, :-width])
+
+def best_match(screen, template, result) -> Tuple[float, Tuple[int, int]]:
+    """
+    Matches a grayscale template against a grayscale screen with the same
+    normalized correlation coefficient as cv2.TM_CCOEFF_NORMED, writing the
+    score map into result. Returns the best score and its (x, y) location.
+    """
+    template_height, template_width = template.shape
+    screen_f = screen.astype(np.float32)
+    template_f = template.astype(np.float32)
+
+    # Centring the template makes the window mean drop out of the numerator,
+    # leaving only the window sums for the denominator.
+    template_f -= template_f.mean()
+    template_norm = float(np.dot(template_f.ravel(), template_f.ravel()))
+
+    window_sums = _window_sums(screen_f, template_height, template_width)
+    window_sq_sums = _window_sums(np.square(screen_f), template_height, template_width)
+
+    _correlate(screen_f, template_f, window_sums, window_sq_sums, template_norm, result)
+
+    index = int(np.argmax(result))
+    y, x = divmod(index, result.shape[1])
+    return float(result[y, x]), (x, y)
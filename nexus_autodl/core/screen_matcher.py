@@ -0,0 +1,349 @@
+"""
+Screen capture and template matching for Nexus AutoDL.
+"""
+
+from collections import namedtuple
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from ..constants import AppConstants
+from ..utils.helpers import is_module_importable, lazy_import
+
+Box = namedtuple("Box", ["left", "top", "width", "height"])
+
+# Returned by the coarse search when its peak could not be confirmed.
+_UNDECIDED = object()
+
+class ScreenMatcher:
+    """
+    Grabs a monitor into persistent ndarray buffers and matches templates
+    against them with OpenCV, without going through PIL on every tick.
+    
+    Without OpenCV, frames set through set_frame() are matched in grayscale
+    by the numba kernel in .ncc when numba is installed. Templates with
+    grayscale switched off are downgraded to grayscale as well, which makes
+    them less selective; a notice is printed once when that backend is used.
+    """
+    
+    _gray_notice_shown = False
+    
+    # Bound per instance by _select_backend().
+    _BACKEND_ATTRS = frozenset(("_load_frame", "_haystack", "_as_needle", "_correlate", "_locate_coarse"))
+    
+    def __init__(self):
+        self._sct: Any = None
+        self._frame_bgr: Optional[Any] = None
+        self._frame_gray: Optional[Any] = None
+        self._source: Optional[Any] = None
+        self._source_codes: Tuple[int, int] = (0, 0)
+        self._bgr_ready = False
+        self._gray_ready = False
+        self._scores: Optional[Any] = None
+        self._last_hits: Dict[Hashable, Tuple[int, int]] = {}
+        self._frame_pyramid: List[Any] = []
+        self._needle_pyramids: Dict[Hashable, Tuple[Any, List[Any]]] = {}
+    
+    def __getattr__(self, name: str):
+        # Only reached while a backend attribute is still unbound, so the first
+        # frame or needle selects the backend and later calls never get here.
+        if name not in ScreenMatcher._BACKEND_ATTRS:
+            raise AttributeError(name)
+        self._select_backend()
+        return self.__dict__[name]
+    
+    def _select_backend(self):
+        # The backend cannot change while the process runs, so it is bound once
+        # instead of being re-tested for every template on every tick. Binding
+        # waits for the first match, so a matcher that only captures regions
+        # never imports OpenCV.
+        if is_module_importable("cv2"):
+            self._load_frame = self._load_frame_cv2
+            self._haystack = self._haystack_cv2
+            self._as_needle = self._as_needle_cv2
+            self._correlate = self._correlate_cv2
+            self._locate_coarse = self._locate_coarse_pyramid
+        else:
+            self._load_frame = self._load_frame_gray
+            self._haystack = self._haystack_gray
+            self._as_needle = self._as_needle_gray
+            self._correlate = self._correlate_numba
+            self._locate_coarse = self._skip_coarse
+            if is_module_importable("numba") and not ScreenMatcher._gray_notice_shown:
+                ScreenMatcher._gray_notice_shown = True
+                print("OpenCV not available; matching every template in grayscale with numba")
+    
+    @staticmethod
+    def is_available() -> bool:
+        return is_module_importable("numpy") and is_module_importable("mss") and is_module_importable("cv2")
+    
+    @staticmethod
+    def can_match() -> bool:
+        return is_module_importable("numpy") and (is_module_importable("cv2") or is_module_importable("numba"))
+    
+    def _ensure_buffers(self, height: int, width: int):
+        if self._frame_bgr is None or self._frame_bgr.shape[:2] != (height, width):
+            np = lazy_import("numpy")
+            self._frame_bgr = np.empty((height, width, 3), dtype=np.uint8)
+            self._frame_gray = np.empty((height, width), dtype=np.uint8)
+            self._scores = np.empty(height * width, dtype=np.float32)
+            self._last_hits.clear()
+        self._bgr_ready = False
+        self._gray_ready = False
+        self._frame_pyramid.clear()
+    
+    def _set_source(self, pixels, to_bgr: int, to_gray: int):
+        self._ensure_buffers(pixels.shape[0], pixels.shape[1])
+        self._source = pixels
+        self._source_codes = (to_bgr, to_gray)
+    
+    def grab_raw(self, region: Dict[str, int]):
+        """
+        Grabs region with the shared mss instance, which keeps its device
+        contexts open between calls instead of recreating them per capture.
+        """
+        if self._sct is None:
+            self._sct = lazy_import("mss").mss()
+        return self._sct.grab(region)
+    
+    def grab(self, monitor: Dict[str, int]):
+        np = lazy_import("numpy")
+        cv2 = lazy_import("cv2")
+        shot = self.grab_raw(monitor)
+        height, width = shot.height, shot.width
+        bgra = np.frombuffer(shot.raw, dtype=np.uint8).reshape(height, width, 4)
+        self._set_source(bgra, cv2.COLOR_BGRA2BGR, cv2.COLOR_BGRA2GRAY)
+    
+    def set_frame(self, image):
+        """
+        Loads a PIL screenshot as the current frame, so that every template
+        matched this tick reuses a single conversion.
+        """
+        self._load_frame(image)
+    
+    def _load_frame_gray(self, image):
+        np = lazy_import("numpy")
+        gray = np.asarray(image.convert('L'))
+        self._set_source(gray, 0, 0)
+        self._frame_gray[...] = gray
+        self._gray_ready = True
+    
+    def _load_frame_cv2(self, image):
+        np = lazy_import("numpy")
+        cv2 = lazy_import("cv2")
+        rgb = np.asarray(image.convert('RGB') if image.mode != 'RGB' else image)
+        self._set_source(rgb, cv2.COLOR_RGB2BGR, cv2.COLOR_RGB2GRAY)
+    
+    def _haystack_gray(self, grayscale: bool):
+        # Without OpenCV, set_frame() already stored the grayscale frame.
+        return self._frame_gray
+    
+    def _haystack_cv2(self, grayscale: bool):
+        # Each colour mode is converted straight from the captured pixels on
+        # first use, so a grayscale tick never builds the BGR frame at all.
+        if grayscale:
+            if not self._gray_ready:
+                cv2 = lazy_import("cv2")
+                cv2.cvtColor(self._source, self._source_codes[1], dst=self._frame_gray)
+                self._gray_ready = True
+            return self._frame_gray
+        if not self._bgr_ready:
+            cv2 = lazy_import("cv2")
+            cv2.cvtColor(self._source, self._source_codes[0], dst=self._frame_bgr)
+            self._bgr_ready = True
+        return self._frame_bgr
+    
+    @staticmethod
+    def _as_needle_gray(template, grayscale: bool):
+        np = lazy_import("numpy")
+        if isinstance(template, np.ndarray):
+            if template.ndim == 3:
+                # BGR arrays, weighted the same way as cv2.COLOR_BGR2GRAY.
+                # Rounded rather than truncated, to stay within a level of OpenCV.
+                return np.rint(np.dot(template[..., :3], (0.114, 0.587, 0.299))).astype(np.uint8)
+            return template
+        return np.asarray(template.convert('L'))
+    
+    @staticmethod
+    def _as_needle_cv2(template, grayscale: bool):
+        np = lazy_import("numpy")
+        cv2 = lazy_import("cv2")
+        if isinstance(template, np.ndarray):
+            if grayscale and template.ndim == 3:
+                return cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+            return template
+        
+        rgb = np.asarray(template.convert('RGB'))
+        return cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY if grayscale else cv2.COLOR_RGB2BGR)
+    
+    def as_needle(self, template, grayscale: bool):
+        """
+        Converts a PIL template to the array locate() would match it as, so
+        callers can convert a template once and pass the array on every tick.
+        """
+        return self._as_needle(template, grayscale)
+    
+    def _best_match(self, haystack, needle) -> Tuple[float, Tuple[int, int]]:
+        # The score map is nearly frame-sized; write it into a view of one
+        # frame-sized buffer instead of allocating it per template per tick.
+        rows = haystack.shape[0] - needle.shape[0] + 1
+        cols = haystack.shape[1] - needle.shape[1] + 1
+        return self._correlate(haystack, needle, self._scores[:rows * cols].reshape(rows, cols))
+    
+    @staticmethod
+    def _correlate_numba(haystack, needle, result) -> Tuple[float, Tuple[int, int]]:
+        from .ncc import best_match
+        return best_match(haystack, needle, result)
+    
+    @staticmethod
+    def _correlate_cv2(haystack, needle, result) -> Tuple[float, Tuple[int, int]]:
+        # matchTemplate already switches to DFT-based correlation for large
+        # templates and normalizes with integral images, so there is no
+        # separate FFT path here.
+        cv2 = lazy_import("cv2")
+        cv2.matchTemplate(haystack, needle, cv2.TM_CCOEFF_NORMED, result=result)
+        # A single vectorized sweep; thresholding and then scanning for the
+        # first hit would read the map twice and report the plateau's corner
+        # rather than its peak.
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        return max_val, max_loc
+    
+    def _locate_near(self, haystack, needle, confidence: float, hint: Tuple[int, int]) -> Optional[Box]:
+        # Larger templates tend to belong to larger widgets that drift further,
+        # so the window grows with the template beyond the fixed minimum.
+        needle_height, needle_width = needle.shape[:2]
+        margin_x = max(AppConstants.MATCH_ROI_MARGIN, int(needle_width * AppConstants.MATCH_ROI_SCALE))
+        margin_y = max(AppConstants.MATCH_ROI_MARGIN, int(needle_height * AppConstants.MATCH_ROI_SCALE))
+        left = max(0, hint[0] - margin_x)
+        top = max(0, hint[1] - margin_y)
+        right = min(haystack.shape[1], hint[0] + needle_width + margin_x)
+        bottom = min(haystack.shape[0], hint[1] + needle_height + margin_y)
+        if right - left < needle_width or bottom - top < needle_height:
+            return None
+        
+        max_val, max_loc = self._best_match(haystack[top:bottom, left:right], needle)
+        if max_val < confidence:
+            return None
+        return Box(left + max_loc[0], top + max_loc[1], needle_width, needle_height)
+    
+    @staticmethod
+    def _pyramid_level(needle) -> int:
+        level = 0
+        smallest_side = min(needle.shape[:2])
+        while (level < AppConstants.MATCH_PYRAMID_LEVELS and
+               smallest_side >> (level + 1) >= AppConstants.MATCH_PYRAMID_MIN_SIZE):
+            level += 1
+        return level
+    
+    @staticmethod
+    def _pyramid_at(pyramid: List[Any], level: int):
+        cv2 = lazy_import("cv2")
+        while len(pyramid) <= level:
+            pyramid.append(cv2.pyrDown(pyramid[-1]))
+        return pyramid[level]
+    
+    @staticmethod
+    def _skip_coarse(haystack, needle, confidence: float, key: Optional[Hashable]):
+        # The pyramid needs cv2.pyrDown; the numba path always searches in full.
+        return _UNDECIDED
+    
+    def _locate_coarse_pyramid(self, haystack, needle, confidence: float, key: Optional[Hashable]):
+        """
+        Matches on a downsampled copy of the frame and confirms the peak at full
+        resolution. Returns a Box, or _UNDECIDED when a full-resolution search
+        is still needed. The coarse level only proposes a candidate; it never
+        decides that the template is absent.
+        """
+        level = self._pyramid_level(needle)
+        if level == 0:
+            return _UNDECIDED
+        
+        # The coarse pass always runs in grayscale, so every template shares one
+        # small frame per tick whatever the colour mode. A template that stands
+        # out mainly by colour can lose its contrast here, which is why only the
+        # full-resolution match in the requested mode may accept or reject it.
+        if not self._frame_pyramid:
+            self._frame_pyramid.append(self._haystack(True))
+        small_haystack = self._pyramid_at(self._frame_pyramid, level)
+        
+        cached = self._needle_pyramids.get(key) if key is not None else None
+        if cached is not None and cached[0] is needle:
+            needle_pyramid = cached[1]
+        else:
+            if needle.ndim == 3:
+                cv2 = lazy_import("cv2")
+                needle_pyramid = [cv2.cvtColor(needle, cv2.COLOR_BGR2GRAY)]
+            else:
+                needle_pyramid = [needle]
+            if key is not None:
+                self._needle_pyramids[key] = (needle, needle_pyramid)
+        small_needle = self._pyramid_at(needle_pyramid, level)
+        
+        if (small_needle.shape[0] > small_haystack.shape[0] or 
+                small_needle.shape[1] > small_haystack.shape[1]):
+            return _UNDECIDED
+        
+        # Downsampling blurs fine detail, so a weak coarse peak says nothing about
+        # the full-resolution score; it is only not worth confirming.
+        max_val, max_loc = self._best_match(small_haystack, small_needle)
+        if max_val < confidence - AppConstants.MATCH_PYRAMID_SLACK:
+            return _UNDECIDED
+        
+        hint = (max_loc[0] << level, max_loc[1] << level)
+        box = self._locate_near(haystack, needle, confidence, hint)
+        return box if box is not None else _UNDECIDED
+    
+    def locate(self, template, grayscale: bool, confidence: float, 
+               key: Optional[Hashable] = None) -> Optional[Box]:
+        """
+        Returns the best match of template in the last grabbed frame, relative
+        to the frame origin, or None if it scores below confidence.
+        
+        When a key is given, the area around that key's previous hit is
+        searched first. Otherwise a grayscale image pyramid proposes where to
+        look, and a full-resolution pass in the requested mode runs whenever
+        that proposal does not hold up.
+        """
+        if self._source is None:
+            return None
+        
+        haystack = self._haystack(grayscale)
+        needle = self._as_needle(template, grayscale)
+        
+        needle_height, needle_width = needle.shape[:2]
+        if needle_height > haystack.shape[0] or needle_width > haystack.shape[1]:
+            return None
+        
+        hint = self._last_hits.get(key) if key is not None else None
+        if hint is not None:
+            box = self._locate_near(haystack, needle, confidence, hint)
+            if box is not None:
+                self._last_hits[key] = (box.left, box.top)
+                return box
+        
+        box = self._locate_coarse(haystack, needle, confidence, key)
+        if box is _UNDECIDED:
+            max_val, max_loc = self._best_match(haystack, needle)
+            box = Box(max_loc[0], max_loc[1], needle_width, needle_height) if max_val >= confidence else None
+        
+        if key is not None:
+            if box is not None:
+                self._last_hits[key] = (box.left, box.top)
+            else:
+                self._last_hits.pop(key, None)
+        return box
+    
+    def close(self):
+        if self._sct is not None:
+            try:
+                self._sct.close()
+            except Exception:
+                pass
+            self._sct = None
+        self._frame_bgr = None
+        self._frame_gray = None
+        self._source = None
+        self._bgr_ready = False
+        self._gray_ready = False
+        self._scores = None
+        self._last_hits.clear()
+        self._frame_pyramid.clear()
+        self._needle_pyramids.clear()
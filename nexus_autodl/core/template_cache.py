@@ -3,92 +3,232 @@ Template cache management for Nexus AutoDL.
 """
 
 import gc
+import os
 import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Optional, Any, NamedTuple, Tuple
 from PIL import Image, UnidentifiedImageError
 from PIL.Image import open as open_image
 
 from ..constants import AppConstants
-from ..utils.helpers import safe_path_operation
+from ..utils.helpers import is_module_importable, lazy_import
+
+class CachedTemplate(NamedTuple):
+    # None when the template was decoded straight to arrays for the matcher;
+    # get_template() then rebuilds a PIL image from the BGR array on demand.
+    image: Optional[Image.Image]
+    mtime: float
+    bgr: Optional[Any] = None
+    gray: Optional[Any] = None
+    nbytes: int = 0
 
 class EnhancedTemplateCache:
     def __init__(self, max_cache_size: int = AppConstants.CACHE_SIZE):
-        self._cache: Dict[str, Image.Image] = {}
-        self._timestamps: Dict[str, float] = {}
-        self._access_order: List[str] = []
+        self._entries: "OrderedDict[str, CachedTemplate]" = OrderedDict()
+        self._last_checked: Dict[str, float] = {}
+        self._missing: Dict[str, float] = {}
         self._max_size = max_cache_size
         self._cache_hits = 0
         self._cache_misses = 0
+        self._dirty = False
+        self._memory_usage = 0
         self._lock = threading.RLock()
     
-    @safe_path_operation
     def get_template(self, template_path: Path) -> Optional[Image.Image]:
-        if not template_path or not template_path.exists():
+        # Copy while holding the lock so another thread cannot evict (and close)
+        # the cached image halfway through.
+        with self._lock:
+            entry = self._lookup(template_path)
+            return self._image_of(entry) if entry else None
+    
+    def get_template_with_arrays(self, template_path: Path, 
+                                 copy_image: bool = True) -> Optional[Tuple[Optional[Image.Image], Any, Any]]:
+        """
+        Returns a private copy of the template together with its pre-decoded
+        (BGR, grayscale) matcher arrays, from a single mtime-checked lookup.
+        The arrays are shared and read-only, so they are safe to use from any thread.
+        
+        With copy_image=False the image is only copied when there are no arrays
+        to match with instead, saving a full pixel copy per template. Uncached
+        templates are then decoded by OpenCV straight into the BGR array.
+        """
+        with self._lock:
+            entry = self._lookup(template_path, prefer_array=not copy_image)
+            if entry is None:
+                return None
+            image = self._image_of(entry) if copy_image or entry.bgr is None else None
+            return image, entry.bgr, entry.gray
+    
+    @staticmethod
+    def _image_of(entry: CachedTemplate) -> Image.Image:
+        if entry.image is not None:
+            return entry.image.copy()
+        np = lazy_import("numpy")
+        return Image.fromarray(np.ascontiguousarray(entry.bgr[:, :, ::-1]))
+    
+    def _lookup(self, template_path: Path, prefer_array: bool = False) -> Optional[CachedTemplate]:
+        if not template_path:
             return None
         
         path_str = str(template_path)
         
         with self._lock:
             try:
-                file_mtime = template_path.stat().st_mtime
+                now = time.monotonic()
                 
-                if (path_str in self._cache and 
-                    path_str in self._timestamps and 
-                    self._timestamps[path_str] >= file_mtime):
-                    
-                    self._update_access_order(path_str)
+                missing_since = self._missing.get(path_str)
+                if missing_since is not None:
+                    if now - missing_since < AppConstants.TEMPLATE_MISSING_TTL:
+                        return None
+                    del self._missing[path_str]
+                
+                entry = self._entries.get(path_str)
+                last_checked = self._last_checked.get(path_str)
+                if (entry is not None and last_checked is not None and
+                        now - last_checked < AppConstants.TEMPLATE_REVALIDATE_INTERVAL):
+                    self._entries.move_to_end(path_str)
+                    self._cache_hits += 1
+                    return entry
+                
+                try:
+                    # os.stat on the string we already hold skips pathlib's own
+                    # str() round-trip; the revalidate window above skips it entirely.
+                    file_mtime = os.stat(path_str).st_mtime
+                except FileNotFoundError:
+                    self._missing[path_str] = now
+                    self._forget(path_str)
+                    return None
+                
+                self._last_checked[path_str] = now
+                
+                if entry is not None and entry.mtime >= file_mtime:
+                    self._entries.move_to_end(path_str)
                     self._cache_hits += 1
-                    return self._cache[path_str].copy()
+                    return entry
+                
+                arrays = self._read_arrays(template_path) if prefer_array and is_module_importable("cv2") else None
+                if arrays is not None:
+                    entry = self._store_entry(path_str, self._make_entry(None, file_mtime, *arrays))
+                    self._cache_misses += 1
+                    return entry
                 
                 template = self._load_template_safely(template_path)
                 if template:
-                    self._store_template(path_str, template, file_mtime)
+                    entry = self._store_template(path_str, template, file_mtime)
                     self._cache_misses += 1
-                    return template.copy()
-                
+                    return entry
+            
             except Exception as e:
                 print(f"Error loading template {template_path}: {e}")
-                return None
+            return None
     
     def _load_template_safely(self, template_path: Path) -> Optional[Image.Image]:
         try:
-            with open_image(template_path) as img:
-                if img.mode not in ('RGB', 'RGBA'):
-                    img = img.convert('RGB')
-                return img.copy()
+            # load() decodes the pixels into memory, so the image stays valid
+            # after the file is closed without needing a detached copy.
+            with open(template_path, 'rb') as f:
+                img = open_image(f)
+                img.load()
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGB')
+            return img
         except (UnidentifiedImageError, OSError, IOError) as e:
             print(f"Failed to load image {template_path}: {e}")
             return None
     
-    def _store_template(self, path_str: str, template: Image.Image, mtime: float):
-        if path_str in self._cache:
-            self._remove_from_cache(path_str)
-        
-        while len(self._cache) >= self._max_size and self._access_order:
-            oldest_path = self._access_order[0]
-            self._remove_from_cache(oldest_path)
+    @staticmethod
+    def _read_arrays(template_path: Path):
+        # imdecode over a byte buffer rather than imread, which cannot open
+        # non-ASCII paths on Windows. Formats OpenCV cannot decode (GIF on most
+        # builds) come back as None and go through PIL instead.
+        try:
+            np = lazy_import("numpy")
+            cv2 = lazy_import("cv2")
+            bgr = cv2.imdecode(np.fromfile(str(template_path), dtype=np.uint8), cv2.IMREAD_COLOR)
+            if bgr is None:
+                return None
+            gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+            bgr.flags.writeable = False
+            gray.flags.writeable = False
+            return bgr, gray
+        except Exception:
+            return None
+    
+    def _build_arrays(self, template: Image.Image):
+        if not is_module_importable("numpy"):
+            return None, None
         
-        self._cache[path_str] = template
-        self._timestamps[path_str] = mtime
-        self._access_order.append(path_str)
+        try:
+            np = lazy_import("numpy")
+            if template.mode not in ('RGB', 'RGBA'):
+                template = template.convert('RGB')
+            # OpenCV (and pyautogui's cv2 backend) treat ndarrays as BGR. PIL's raw
+            # encoder emits that layout in one pass, and the array wraps its bytes
+            # without another copy; being backed by bytes it is read-only already.
+            bgr = np.frombuffer(template.tobytes('raw', 'BGR'), dtype=np.uint8).reshape(
+                template.height, template.width, 3)
+            gray = None
+            if is_module_importable("cv2"):
+                cv2 = lazy_import("cv2")
+                gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+                gray.flags.writeable = False
+            return bgr, gray
+        except Exception as e:
+            print(f"Failed to precompute template arrays: {e}")
+            return None, None
     
-    def _update_access_order(self, path_str: str):
-        if path_str in self._access_order:
-            self._access_order.remove(path_str)
-        self._access_order.append(path_str)
+    @staticmethod
+    def _make_entry(image: Optional[Image.Image], mtime: float, bgr, gray) -> CachedTemplate:
+        # Sized once here so get_cache_stats never has to walk the entries.
+        nbytes = ((image.width * image.height * len(image.getbands()) if image is not None else 0)
+                  + (bgr.nbytes if bgr is not None else 0)
+                  + (gray.nbytes if gray is not None else 0))
+        return CachedTemplate(image, mtime, bgr, gray, nbytes)
     
-    def _remove_from_cache(self, path_str: str):
-        if path_str in self._cache:
-            try:
-                self._cache[path_str].close()
-            except Exception:
-                pass
+    def _add_entry(self, path_str: str, entry: CachedTemplate):
+        self._entries[path_str] = entry
+        self._memory_usage += entry.nbytes
+    
+    def _drop_entry(self, entry: CachedTemplate):
+        self._memory_usage -= entry.nbytes
+        self._close_image(entry.image)
+    
+    def _store_template(self, path_str: str, template: Image.Image, mtime: float) -> CachedTemplate:
+        bgr, gray = self._build_arrays(template)
+        return self._store_entry(path_str, self._make_entry(template, mtime, bgr, gray))
+    
+    def _store_entry(self, path_str: str, entry: CachedTemplate) -> CachedTemplate:
+        old_entry = self._entries.pop(path_str, None)
+        if old_entry is not None:
+            self._drop_entry(old_entry)
         
-        self._cache.pop(path_str, None)
-        self._timestamps.pop(path_str, None)
-        if path_str in self._access_order:
-            self._access_order.remove(path_str)
+        self._add_entry(path_str, entry)
+        self._dirty = True
+        self._evict_overflow()
+        return entry
+    
+    def _evict_overflow(self):
+        while len(self._entries) > self._max_size:
+            evicted_path, evicted = self._entries.popitem(last=False)
+            self._last_checked.pop(evicted_path, None)
+            self._drop_entry(evicted)
+    
+    def _forget(self, path_str: str):
+        entry = self._entries.pop(path_str, None)
+        if entry is not None:
+            self._drop_entry(entry)
+        self._last_checked.pop(path_str, None)
+    
+    @staticmethod
+    def _close_image(img: Optional[Image.Image]):
+        if img is None:
+            return
+        try:
+            img.close()
+        except Exception:
+            pass
     
     def invalidate_template(self, template_path: Path):
         if not template_path:
@@ -96,39 +236,129 @@ class EnhancedTemplateCache:
         
         path_str = str(template_path)
         with self._lock:
-            self._remove_from_cache(path_str)
+            self._forget(path_str)
+            self._missing.pop(path_str, None)
     
     def clear_cache(self):
         with self._lock:
-            for img in self._cache.values():
-                try:
-                    img.close()
-                except Exception:
-                    pass
+            for entry in self._entries.values():
+                self._close_image(entry.image)
             
-            self._cache.clear()
-            self._timestamps.clear()
-            self._access_order.clear()
+            self._entries.clear()
+            self._memory_usage = 0
+            self._last_checked.clear()
+            self._missing.clear()
             self._cache_hits = 0
             self._cache_misses = 0
-            gc.collect()
+            self._dirty = False
+            # close() has already released the pixel buffers; a full collection
+            # would walk every Tk and PIL object in the process on the UI thread.
+            if AppConstants.FORCE_GC_ON_CLEAR:
+                gc.collect()
+    
+    @property
+    def is_dirty(self) -> bool:
+        return self._dirty
+    
+    def load_from_disk(self, cache_file: Path) -> int:
+        """
+        Restores decoded templates written by save_to_disk(). Restored entries
+        are still checked against the file's mtime on their first lookup.
+        """
+        if not cache_file.is_file() or not is_module_importable("numpy"):
+            return 0
+        
+        directory = cache_file.parent
+        loaded = 0
+        try:
+            np = lazy_import("numpy")
+            cv2 = lazy_import("cv2") if is_module_importable("cv2") else None
+            with np.load(cache_file, allow_pickle=False) as data:
+                names = data['names']
+                mtimes = data['mtimes']
+                
+                with self._lock:
+                    for i, name in enumerate(names):
+                        path_str = str(directory / str(name))
+                        if path_str in self._entries:
+                            continue
+                        
+                        # matchTemplate needs the frame's 8-bit depth; anything else
+                        # is a foreign cache, so let the file be decoded afresh.
+                        bgr = data[f'bgr_{i}']
+                        if bgr.dtype != np.uint8 or bgr.ndim != 3:
+                            continue
+                        
+                        gray_key = f'gray_{i}'
+                        gray = data[gray_key] if gray_key in data.files else None
+                        if gray is None or gray.dtype != np.uint8:
+                            gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY) if cv2 is not None else None
+                        
+                        bgr.flags.writeable = False
+                        if gray is not None:
+                            gray.flags.writeable = False
+                        self._add_entry(path_str, self._make_entry(None, float(mtimes[i]), bgr, gray))
+                        loaded += 1
+                    
+                    self._evict_overflow()
+        except Exception as e:
+            print(f"Failed to load template cache {cache_file}: {e}")
+        return loaded
+    
+    def save_to_disk(self, cache_file: Path) -> bool:
+        """
+        Writes the decoded arrays of templates living next to cache_file.
+        Only the BGR array is persisted, so entries holding an RGBA image are
+        skipped to keep their alpha for previews. Array-only entries (decoded
+        by OpenCV, which already dropped any alpha) are written as they are.
+        """
+        if not is_module_importable("numpy"):
+            return False
+        
+        directory = str(cache_file.parent)
+        with self._lock:
+            entries = [
+                (Path(path_str).name, entry)
+                for path_str, entry in self._entries.items()
+                if entry.bgr is not None and (entry.image is None or entry.image.mode == 'RGB')
+                and str(Path(path_str).parent) == directory
+            ]
+            self._dirty = False
+        
+        if not entries:
+            return False
+        
+        np = lazy_import("numpy")
+        arrays: Dict[str, Any] = {
+            'names': np.array([name for name, _ in entries]),
+            'mtimes': np.array([entry.mtime for _, entry in entries], dtype=np.float64)
+        }
+        for i, (_, entry) in enumerate(entries):
+            arrays[f'bgr_{i}'] = entry.bgr
+            if entry.gray is not None:
+                arrays[f'gray_{i}'] = entry.gray
+        
+        temp_path = cache_file.with_suffix('.tmp')
+        try:
+            with open(temp_path, 'wb') as f:
+                np.savez(f, **arrays)
+            temp_path.replace(cache_file)
+            return True
+        except (OSError, ValueError) as e:
+            print(f"Failed to save template cache {cache_file}: {e}")
+            return False
     
     def get_cache_stats(self) -> Dict[str, Any]:
         with self._lock:
             total_requests = self._cache_hits + self._cache_misses
             hit_rate = (self._cache_hits / total_requests * 100) if total_requests > 0 else 0
             
-            memory_usage = sum(
-                img.width * img.height * len(img.getbands()) 
-                for img in self._cache.values()
-            ) if self._cache else 0
-            
             return {
-                'cache_size': len(self._cache),
+                'cache_size': len(self._entries),
                 'max_size': self._max_size,
                 'hits': self._cache_hits,
                 'misses': self._cache_misses,
                 'hit_rate': hit_rate,
-                'memory_usage_bytes': memory_usage,
-                'cached_templates': list(self._cache.keys())
+                'memory_usage_bytes': self._memory_usage,
+                'cached_templates': list(self._entries.keys())
             }
@@ -5,12 +5,13 @@ Main entry point for Nexus AutoDL.
 import sys
 from tkinter import Tk
 
-try:
-    from pynput import keyboard
-    import pyautogui
-    from PIL import Image
-except ImportError as e:
-    print(f"Error: A critical library is missing: {e.name}.")
+from .utils.helpers import is_module_available
+
+# Only check that the critical libraries are installed here; the heavy ones are
+# imported lazily once automation actually needs them.
+_missing = next((name for name in ("pynput", "pyautogui", "PIL") if not is_module_available(name)), None)
+if _missing:
+    print(f"Error: A critical library is missing: {_missing}.")
     print("Please, run in your terminal: pip install pyautogui Pillow pynput")
     sys.exit(1)
 
@@ -1,11 +1,13 @@
 import json
 import os
+import queue
 import random
 import shutil
 import weakref
 import threading
+import time
 import gc
-from collections import namedtuple
+from collections import deque, namedtuple
 from datetime import datetime
 from pathlib import Path
 from tkinter import (
@@ -13,10 +15,11 @@ from tkinter import (
     StringVar, BooleanVar, DoubleVar, IntVar, 
     filedialog, messagebox, simpledialog, colorchooser,
     Checkbutton, Radiobutton, Listbox, Scrollbar, Text,
-    LabelFrame
+    LabelFrame, TclError
 )
 from tkinter import ttk
-from typing import Dict, List, Optional, Tuple, Union, Any, TYPE_CHECKING
+from tkinter import font as tkfont
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from PIL.Image import Image as PILImageType
@@ -24,11 +27,10 @@ else:
     PILImageType = Any
 
 try:
-    from PIL import Image, ImageTk
+    from PIL import Image
     from PIL import UnidentifiedImageError
 except ImportError:
     Image = None  # type: ignore[assignment]
-    ImageTk = None  # type: ignore[assignment]
     UnidentifiedImageError = Exception  # type: ignore[assignment]
 
 
@@ -37,8 +39,6 @@ def open_image(path: str):
         raise ImportError("Pillow is required to open images")
     return Image.open(path)
 
-import pyautogui
-
 mss: Any
 try:
     import mss as mss_module
@@ -47,22 +47,63 @@ try:
 except ImportError:
     mss = None  # type: ignore[assignment]
     MSS_AVAILABLE = False
-from pynput import keyboard
-
-try:
-    import cv2
-    HAS_CV2 = True
-except ImportError:
-    HAS_CV2 = False
 
 from ..constants import AppConstants
-from ..utils.helpers import human_sort_key, safe_path_operation, validate_filename
+from ..utils.helpers import (
+    cached_dir_listing, clear_human_sort_cache, dump_json, invalidate_dir_listing, 
+    is_module_importable, lazy_import, load_json, safe_path_operation, validate_filename
+)
 from .theme_manager import ThemeManager
 from .components import OptimizedHoverEffect, EnhancedTooltip
 from ..core.template_cache import EnhancedTemplateCache
+from ..core.screen_matcher import ScreenMatcher
 from .windows import EnhancedProfileManagerWindow
 
+# pyautogui, pynput and OpenCV are only needed once automation starts, so they
+# are imported on first use to keep them off the startup path. OpenCV is
+# checked with is_module_importable() where a backend is picked, so a build
+# that is installed but fails to load falls back as if it were missing.
+
+class ProfileOptions(NamedTuple):
+    """Validated per-profile settings; the defaults apply to unset or invalid values."""
+    confidence: float = 0.8
+    grayscale: bool = True
+    min_sleep: float = 1.0
+    max_sleep: float = 5.0
+    cooldown: float = 0.0
+    search_mode: str = "priority"
+
+class MatchTarget(NamedTuple):
+    name: str
+    needle: Any
+
+class MatchSettings(NamedTuple):
+    """Everything the match worker reads, snapshotted on the Tk thread at start."""
+    run_id: int
+    stop: threading.Event
+    profile_name: str
+    monitor: Optional[Dict[str, int]]
+    search_mode: str
+    grayscale: bool
+    confidence: float
+    search_kwargs: Dict[str, object]
+    min_sleep: float
+    max_sleep: float
+    cooldown: float
+    priority_targets: Tuple[MatchTarget, ...]
+    sequence_targets: Tuple[MatchTarget, ...]
+
 class NexusAutoDL:
+    MAIN_FRAME_NAME = "main"
+    
+    # (label, entry attribute, variable attribute, row, column)
+    _TUNING_FIELDS = (
+        ("Confidence:", "confidence_entry", "confidence", 0, 0),
+        ("Min Sleep (s):", "min_sleep_entry", "min_sleep_seconds", 1, 0),
+        ("Max Sleep (s):", "max_sleep_entry", "max_sleep_seconds", 1, 2),
+        ("Cooldown (s):", "cooldown_entry", "cooldown_seconds", 1, 4),
+    )
+    
     def __init__(self, root: Tk):
         self.root = root
         self.root.title(f"Nexus AutoDL {AppConstants.VERSION}")
@@ -76,16 +117,23 @@ class NexusAutoDL:
         
         self.theme_manager = ThemeManager(is_dark_mode=self.dark_mode.get())
         self.root.config(bg=self.theme_manager.get_color('bg_color'))
+        self._init_fonts()
+        self._style = ttk.Style(self.root)
         
         self.template_cache = EnhancedTemplateCache(max_cache_size=AppConstants.CACHE_SIZE)
-        self.templates: Dict[str, PILImageType] = {}
+        # Values are PIL images, or the shared BGR arrays when OpenCV can match them.
+        self.templates: Dict[str, Any] = {}
+        self._template_arrays: Dict[str, Tuple[Any, Any]] = {}
+        self._priority_order: Tuple[str, ...] = ()
+        self.screen_matcher = ScreenMatcher()
         
         self._setup_ttk_style()
         self._setup_ui()
         self._update_profile_list()
         self._update_always_on_top()
         
-        self._init_keyboard_listener()
+        self.keyboard_listener = None
+        self.root.after_idle(self._init_keyboard_listener)
         
         self.root.protocol("WM_DELETE_WINDOW", self._terminate_app)
     
@@ -94,6 +142,7 @@ class NexusAutoDL:
         self.grayscale = BooleanVar()
         self.min_sleep_seconds = DoubleVar()
         self.max_sleep_seconds = DoubleVar()
+        self.cooldown_seconds = DoubleVar()
         self.search_mode = StringVar()
         
         self.always_on_top = BooleanVar()
@@ -105,12 +154,45 @@ class NexusAutoDL:
         
         self.profiles_root_path = StringVar()
         self.active_profile = StringVar()
+        
+        self._profiles_root: Optional[Path] = None
+        self.profiles_root_path.trace_add("write", self._on_profiles_root_changed)
+    
+    def _on_profiles_root_changed(self, *args):
+        self._profiles_root = None
+        clear_human_sort_cache()
+        invalidate_dir_listing()
+    
+    @property
+    def profiles_root(self) -> Path:
+        if self._profiles_root is None:
+            self._profiles_root = Path(self.profiles_root_path.get())
+        return self._profiles_root
     
     def _init_state(self):
         self._is_running = False
-        self._after_id: Optional[str] = None
+        self._match_queue: "queue.Queue[Tuple[str, Optional[int], tuple]]" = queue.Queue()
+        self._match_stop = threading.Event()
+        self._match_thread: Optional[threading.Thread] = None
+        self._match_run_id = 0
+        self._queue_poll_id: Optional[str] = None
+        self._match_idle_until: Tuple[int, float] = (0, 0.0)
+        self._cache_flush_id: Optional[str] = None
+        # Profiles whose folder is being removed in the background; the cache
+        # flush must not write a new .npz into them mid-delete.
+        self._profiles_being_deleted: Set[str] = set()
+        self._config_flush_id: Optional[str] = None
+        self._last_saved_config: Optional[bytes] = None
+        self._config_dirty = False
+        self._profile_settings: Dict[str, Dict[str, Any]] = {}
+        self._profile_options_cache: Dict[str, Tuple[Dict[str, Any], ProfileOptions]] = {}
         self._last_active_profile = ""
-        self.sequence_index = 0
+        self._sequence_order: List[str] = []
+        self._last_key_times: Dict[Any, float] = {}
+        self._hotkey_actions: Dict[Any, Any] = {}
+        self._hotkey_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        # Set while a <<Hotkey>> wake-up is on its way to the Tk thread.
+        self._hotkey_wake_pending = threading.Event()
 
         self._monitors: List[Dict[str, int]] = []
         self._monitor_labels: List[str] = []
@@ -118,8 +200,14 @@ class NexusAutoDL:
         
         self.log_window: Optional[Toplevel] = None
         self.log_text_widget: Optional[Text] = None
+        self._log_buffer: "deque[str]" = deque(maxlen=AppConstants.LOG_BUFFER_SIZE)
+        self._log_flush_id: Optional[str] = None
         self.capture_window: Optional[Toplevel] = None
         self.capture_canvas: Optional[Canvas] = None
+        self._feedback_window: Optional[Toplevel] = None
+        self._feedback_frame: Optional[Frame] = None
+        self._feedback_frame_color: Optional[str] = None
+        self._feedback_shown_count = 0
         self.rect: Optional[int] = None
         self.start_x: Optional[float] = None
         self.start_y: Optional[float] = None
@@ -127,9 +215,24 @@ class NexusAutoDL:
         self.hover_effects: List[OptimizedHoverEffect] = []
         self.tooltips: List[EnhancedTooltip] = []
     
+    def _init_fonts(self):
+        # Named fonts are resolved by Tk once and shared by every widget that
+        # uses them, instead of re-parsing a font tuple per widget.
+        self.font_body = tkfont.Font(root=self.root, family="Segoe UI", size=9)
+        self.font_small = tkfont.Font(root=self.root, family="Segoe UI", size=8)
+        self.font_heading = tkfont.Font(root=self.root, family="Segoe UI", size=10, weight="bold")
+        self.font_mono = tkfont.Font(root=self.root, family="Consolas", size=9)
+    
     def _init_keyboard_listener(self):
         try:
+            keyboard = lazy_import("pynput.keyboard")
+            self._hotkey_actions = {
+                keyboard.Key.f3: self._start_handler,
+                keyboard.Key.f4: self._pause_handler,
+                keyboard.Key.esc: self._cancel_capture,
+            }
             self.keyboard_listener = keyboard.Listener(on_press=self._on_key_press)
+            self.root.bind("<<Hotkey>>", self._drain_hotkeys)
             self.keyboard_listener.start()
         except Exception as e:
             print(f"Failed to initialize keyboard listener: {e}")
@@ -169,34 +272,35 @@ class NexusAutoDL:
     
     def _setup_ttk_style(self):
         try:
-            style = ttk.Style()
+            theme = self.theme_manager.current_theme
+            style = self._style
             style.theme_use('clam')
             
             style.configure("TCombobox", 
-                           fieldbackground=self.theme_manager.get_color('input_bg_color'), 
-                           background=self.theme_manager.get_color('button_bg_color'), 
-                           foreground=self.theme_manager.get_color('input_fg_color'), 
-                           arrowcolor=self.theme_manager.get_color('fg_color'), 
-                           selectbackground=self.theme_manager.get_color('selection_bg_color'), 
-                           selectforeground=self.theme_manager.get_color('selection_fg_color'), 
-                           bordercolor=self.theme_manager.get_color('border_color'),
-                           lightcolor=self.theme_manager.get_color('bg_color'), 
-                           darkcolor=self.theme_manager.get_color('bg_color'))
+                           fieldbackground=theme['input_bg_color'], 
+                           background=theme['button_bg_color'], 
+                           foreground=theme['input_fg_color'], 
+                           arrowcolor=theme['fg_color'], 
+                           selectbackground=theme['selection_bg_color'], 
+                           selectforeground=theme['selection_fg_color'], 
+                           bordercolor=theme['border_color'],
+                           lightcolor=theme['bg_color'], 
+                           darkcolor=theme['bg_color'])
             
             style.map('TCombobox', 
-                     fieldbackground=[('readonly', self.theme_manager.get_color('readonly_bg_color'))], 
-                     selectbackground=[('readonly', self.theme_manager.get_color('selection_bg_color'))], 
-                     selectforeground=[('readonly', self.theme_manager.get_color('selection_fg_color'))])
+                     fieldbackground=[('readonly', theme['readonly_bg_color'])], 
+                     selectbackground=[('readonly', theme['selection_bg_color'])], 
+                     selectforeground=[('readonly', theme['selection_fg_color'])])
             
             style.configure("TRadiobutton", 
-                           background=self.theme_manager.get_color('bg_color'), 
-                           foreground=self.theme_manager.get_color('fg_color'), 
-                           indicatorcolor=self.theme_manager.get_color('input_bg_color'))
+                           background=theme['bg_color'], 
+                           foreground=theme['fg_color'], 
+                           indicatorcolor=theme['input_bg_color'])
             
             style.map("TRadiobutton", 
-                     background=[('active', self.theme_manager.get_color('bg_color'))], 
-                     indicatorcolor=[('active', self.theme_manager.get_color('selection_bg_color'))], 
-                     foreground=[('active', self.theme_manager.get_color('fg_color'))])
+                     background=[('active', theme['bg_color'])], 
+                     indicatorcolor=[('active', theme['selection_bg_color'])], 
+                     foreground=[('active', theme['fg_color'])])
         except Exception as e:
             print(f"Failed to setup TTK styles: {e}")
 
@@ -210,18 +314,19 @@ class NexusAutoDL:
         self.hover_effects.clear()
         self.tooltips.clear()
         
-        main_frame = Frame(self.root, padx=12, pady=12, bg=self.theme_manager.get_color('bg_color'))
+        self._register_widget_options()
+        
+        main_frame = Frame(self.root, name=self.MAIN_FRAME_NAME, padx=12, pady=12, 
+                           bg=self.theme_manager.get_color('bg_color'))
         main_frame.grid(row=0, column=0, sticky="nsew")
         self.root.grid_columnconfigure(0, weight=1)
         
-        styles = self._create_style_dictionaries()
-        
-        self._create_profile_section(main_frame, styles)
-        self._create_tuning_section(main_frame, styles)
-        self._create_display_section(main_frame, styles)
-        self._create_sequence_section(main_frame, styles)
-        self._create_action_section(main_frame, styles)
-        self._create_status_section(main_frame, styles)
+        self._create_profile_section(main_frame)
+        self._create_tuning_section(main_frame)
+        self._create_display_section(main_frame)
+        self._create_sequence_section(main_frame)
+        self._create_action_section(main_frame)
+        self._create_status_section(main_frame)
         
         main_frame.grid_columnconfigure(0, weight=1)
         
@@ -230,67 +335,84 @@ class NexusAutoDL:
         self._toggle_feedback_options()
         self._toggle_sequence_editor()
     
-    def _create_style_dictionaries(self) -> Dict[str, Dict[str, Any]]:
-        return {
-            'label': {
-                "bg": self.theme_manager.get_color('bg_color'), 
-                "fg": self.theme_manager.get_color('fg_color'), 
-                "font": ("Segoe UI", 9)
-            },
-            'entry': {
-                "bg": self.theme_manager.get_color('input_bg_color'), 
-                "fg": self.theme_manager.get_color('input_fg_color'), 
-                "insertbackground": self.theme_manager.get_color('input_fg_color'), 
-                "bd": 1, "highlightthickness": 0, "font": ("Segoe UI", 9)
-            },
-            'button': {
-                "bg": self.theme_manager.get_color('button_bg_color'), 
-                "fg": self.theme_manager.get_color('button_fg_color'), 
-                "bd": 0, "padx": 12, "pady": 5, "font": ("Segoe UI", 9), 
-                "cursor": "hand2", "relief": "flat"
-            },
-            'checkbox': {
-                "bg": self.theme_manager.get_color('bg_color'),
-                "fg": self.theme_manager.get_color('fg_color'),
-                "font": ("Segoe UI", 9),
-                "selectcolor": self.theme_manager.get_color('input_bg_color'), 
-                "activebackground": self.theme_manager.get_color('bg_color')
-            },
-            'labelframe': {
-                "bg": self.theme_manager.get_color('bg_color'), 
-                "fg": self.theme_manager.get_color('fg_color'), 
-                "padx": 12, "pady": 10, "font": ("Segoe UI", 10, "bold")
-            }
+    def _register_widget_options(self):
+        """
+        Registers the shared look of the main window's classic widgets in the
+        Tk option database, so widgets pick it up by class instead of every
+        constructor call passing the same options again.
+        """
+        theme = self.theme_manager.current_theme
+        options = {
+            "Label.background": theme['bg_color'],
+            "Label.foreground": theme['fg_color'],
+            "Label.font": self.font_body,
+            
+            "Entry.background": theme['input_bg_color'],
+            "Entry.foreground": theme['input_fg_color'],
+            "Entry.insertBackground": theme['input_fg_color'],
+            "Entry.borderWidth": 1,
+            "Entry.highlightThickness": 0,
+            "Entry.font": self.font_body,
+            
+            "Button.background": theme['button_bg_color'],
+            "Button.foreground": theme['button_fg_color'],
+            "Button.borderWidth": 0,
+            "Button.padX": 12,
+            "Button.padY": 5,
+            "Button.font": self.font_body,
+            "Button.cursor": "hand2",
+            "Button.relief": "flat",
+            
+            "Checkbutton.background": theme['bg_color'],
+            "Checkbutton.foreground": theme['fg_color'],
+            "Checkbutton.font": self.font_body,
+            "Checkbutton.selectColor": theme['input_bg_color'],
+            "Checkbutton.activeBackground": theme['bg_color'],
+            
+            "Labelframe.background": theme['bg_color'],
+            "Labelframe.foreground": theme['fg_color'],
+            "Labelframe.padX": 12,
+            "Labelframe.padY": 10,
+            "Labelframe.font": self.font_heading,
         }
+        
+        # Scoped to the main frame so dialogs and other windows keep their own look.
+        scope = f"*{self.MAIN_FRAME_NAME}*"
+        for pattern, value in options.items():
+            self.root.option_add(scope + pattern, value)
     
-    def _create_profile_section(self, parent, styles):
-        self.profile_frame = LabelFrame(parent, text="Profile Settings", **styles['labelframe'])
+    def _create_profile_section(self, parent):
+        self.profile_frame = LabelFrame(parent, text="Profile Settings")
         self.profile_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
         
-        Label(self.profile_frame, text="Active Profile:", **styles['label']).grid(row=0, column=0, sticky="w", pady=3)
+        Label(self.profile_frame, text="Active Profile:").grid(row=0, column=0, sticky="w", pady=3)
         
         self.profile_combobox = ttk.Combobox(self.profile_frame, textvariable=self.active_profile, 
-                                            state="readonly", width=28, font=("Segoe UI", 9))
+                                            state="readonly", width=28, font=self.font_body)
         self.profile_combobox.grid(row=0, column=1, sticky="ew", padx=(8, 8), pady=3)
         self.profile_combobox.bind("<<ComboboxSelected>>", self._on_profile_change)
         
         self.manage_profiles_button = Button(self.profile_frame, text="Manage...", 
-                                           command=self._open_profile_manager, **styles['button'])
+                                           command=self._open_profile_manager)
         self.manage_profiles_button.grid(row=0, column=2, pady=3)
         self.profile_frame.grid_columnconfigure(1, weight=1)
         
         hover_effect = OptimizedHoverEffect(self.manage_profiles_button, 'manage', self.theme_manager)
         self.hover_effects.append(hover_effect)
     
-    def _create_tuning_section(self, parent, styles):
-        tuning_frame = LabelFrame(parent, text="Automation Tuning", **styles['labelframe'])
+    def _create_tuning_section(self, parent):
+        tuning_frame = LabelFrame(parent, text="Automation Tuning")
         tuning_frame.grid(row=1, column=0, sticky="ew", pady=10)
         
-        Label(tuning_frame, text="Confidence:", **styles['label']).grid(row=0, column=0, sticky="w", pady=3)
-        self.confidence_entry = Entry(tuning_frame, textvariable=self.confidence, **styles['entry'], width=10)
-        self.confidence_entry.grid(row=0, column=1, padx=(8, 0), pady=3)
+        for text, entry_attr, variable_attr, row, column in self._TUNING_FIELDS:
+            pady = 3 if row == 0 else (10, 3)
+            Label(tuning_frame, text=text).grid(
+                row=row, column=column, sticky="w", padx=(20, 0) if column else 0, pady=pady)
+            entry = Entry(tuning_frame, textvariable=getattr(self, variable_attr), width=10)
+            entry.grid(row=row, column=column + 1, padx=(8, 0), pady=pady)
+            setattr(self, entry_attr, entry)
         
-        Label(tuning_frame, text="Search Mode:", **styles['label']).grid(row=0, column=2, sticky="w", padx=(20,0), pady=3)
+        Label(tuning_frame, text="Search Mode:").grid(row=0, column=2, sticky="w", padx=(20,0), pady=3)
         radio_frame = Frame(tuning_frame, bg=self.theme_manager.get_color('bg_color'))
         radio_frame.grid(row=0, column=3, columnspan=3, sticky="w", padx=(8, 0), pady=3)
         
@@ -302,57 +424,47 @@ class NexusAutoDL:
                                              value="sequence", command=self._toggle_sequence_editor, style="TRadiobutton")
         self.sequence_radio.pack(side="left")
         
-        Label(tuning_frame, text="Min Sleep (s):", **styles['label']).grid(row=1, column=0, sticky="w", pady=(10,3))
-        self.min_sleep_entry = Entry(tuning_frame, textvariable=self.min_sleep_seconds, **styles['entry'], width=10)
-        self.min_sleep_entry.grid(row=1, column=1, padx=(8, 0), pady=(10,3))
-        
-        Label(tuning_frame, text="Max Sleep (s):", **styles['label']).grid(row=1, column=2, sticky="w", padx=(20, 0), pady=(10,3))
-        self.max_sleep_entry = Entry(tuning_frame, textvariable=self.max_sleep_seconds, **styles['entry'], width=10)
-        self.max_sleep_entry.grid(row=1, column=3, padx=(8, 0), pady=(10,3))
-        
         self.grayscale_check = Checkbutton(tuning_frame, text="Grayscale Matching", 
-                                          variable=self.grayscale, **styles['checkbox'])
+                                          variable=self.grayscale)
         self.grayscale_check.grid(row=2, column=0, columnspan=2, sticky='w', pady=(10,3))
     
-    def _create_display_section(self, parent, styles):
-        display_frame = LabelFrame(parent, text="Display & Appearance", **styles['labelframe'])
+    def _create_display_section(self, parent):
+        display_frame = LabelFrame(parent, text="Display & Appearance")
         display_frame.grid(row=2, column=0, sticky="ew", pady=10)
         
         self.always_on_top_check = Checkbutton(display_frame, text="Always on Top", 
-                                              variable=self.always_on_top, command=self._update_always_on_top, 
-                                              **styles['checkbox'])
+                                              variable=self.always_on_top, command=self._update_always_on_top)
         self.always_on_top_check.grid(row=0, column=0, sticky='w', pady=3)
         
         self.dark_mode_check = Checkbutton(display_frame, text="Dark Mode", 
-                                          variable=self.dark_mode, command=self._toggle_theme, 
-                                          **styles['checkbox'])
+                                          variable=self.dark_mode, command=self._toggle_theme)
         self.dark_mode_check.grid(row=0, column=1, sticky='w', padx=(30, 0), pady=3)
         
         self.visual_feedback_check = Checkbutton(display_frame, text="Visual Feedback", 
                                                 variable=self.show_visual_feedback, 
-                                                command=self._toggle_feedback_options, 
-                                                **styles['checkbox'])
+                                                command=self._toggle_feedback_options)
         self.visual_feedback_check.grid(row=1, column=0, columnspan=2, sticky='w', pady=(8,3))
 
-        Label(display_frame, text="Target Monitor:", **styles['label']).grid(
+        Label(display_frame, text="Target Monitor:").grid(
             row=3, column=0, sticky='w', pady=(8, 3)
         )
         self.monitor_combobox = ttk.Combobox(
             display_frame,
             state="readonly",
             width=42,
-            font=("Segoe UI", 9)
+            font=self.font_body
         )
         self.monitor_combobox.grid(row=3, column=1, columnspan=2, sticky='w', padx=(8, 0), pady=(8, 3))
         self.monitor_combobox.bind("<<ComboboxSelected>>", self._on_monitor_change)
         self._populate_monitor_selector()
         
         self.feedback_options_frame = Frame(display_frame, bg=self.theme_manager.get_color('bg_color'))
+        self._feedback_frame_visible = False
         
-        self._create_feedback_options(styles)
+        self._create_feedback_options()
     
-    def _create_feedback_options(self, styles):
-        Label(self.feedback_options_frame, text="Color:", **styles['label']).grid(row=0, column=0, sticky="w", pady=3)
+    def _create_feedback_options(self):
+        Label(self.feedback_options_frame, text="Color:").grid(row=0, column=0, sticky="w", pady=3)
         
         self.color_swatch = Label(self.feedback_options_frame, text="   ", 
                                  bg=self.feedback_color.get(), relief="solid", bd=1, cursor="hand2")
@@ -360,71 +472,74 @@ class NexusAutoDL:
         self.color_swatch.bind("<Button-1>", self._choose_color)
         
         self.color_entry = Entry(self.feedback_options_frame, textvariable=self.feedback_color, 
-                                **styles['entry'], width=8, state="readonly", 
+                                width=8, state="readonly", 
                                 readonlybackground=self.theme_manager.get_color('readonly_bg_color'))
         self.color_entry.grid(row=0, column=2, pady=3)
         
-        Label(self.feedback_options_frame, text="Duration (ms):", **styles['label']).grid(row=0, column=3, sticky="w", padx=(15,0), pady=3)
-        self.duration_entry = Entry(self.feedback_options_frame, textvariable=self.feedback_duration, 
-                                   **styles['entry'], width=8)
+        Label(self.feedback_options_frame, text="Duration (ms):").grid(row=0, column=3, sticky="w", padx=(15,0), pady=3)
+        self.duration_entry = Entry(self.feedback_options_frame, textvariable=self.feedback_duration, width=8)
         self.duration_entry.grid(row=0, column=4, padx=(8, 0), pady=3)
     
-    def _create_sequence_section(self, parent, styles):
-        self.sequence_frame = LabelFrame(parent, text="Sequence Editor", **styles['labelframe'])
+    def _create_sequence_section(self, parent):
+        theme = self.theme_manager.current_theme
+        
+        self.sequence_frame = LabelFrame(parent, text="Sequence Editor")
+        self._sequence_frame_visible = False
         
         self.sequence_listbox = Listbox(self.sequence_frame, 
-                                       bg=self.theme_manager.get_color('input_bg_color'), 
-                                       fg=self.theme_manager.get_color('input_fg_color'), 
+                                       bg=theme['input_bg_color'], 
+                                       fg=theme['input_fg_color'], 
                                        bd=0, highlightthickness=0, 
-                                       selectbackground=self.theme_manager.get_color('selection_bg_color'), 
-                                       selectforeground=self.theme_manager.get_color('selection_fg_color'),
-                                       height=4, exportselection=False, font=("Segoe UI", 9))
+                                       selectbackground=theme['selection_bg_color'], 
+                                       selectforeground=theme['selection_fg_color'],
+                                       height=4, exportselection=False, font=self.font_body)
         self.sequence_listbox.pack(side="left", fill="x", expand=True, padx=(0, 8))
+        self._sequence_order = []
         
-        seq_button_frame = Frame(self.sequence_frame, bg=self.theme_manager.get_color('bg_color'))
+        seq_button_frame = Frame(self.sequence_frame, bg=theme['bg_color'])
         seq_button_frame.pack(side="right")
         
-        seq_button_style = {**styles['button'], "padx": 8, "pady": 3}
-        
-        self.up_btn = Button(seq_button_frame, text="▲", command=self._move_template_up, **seq_button_style)
+        self.up_btn = Button(seq_button_frame, text="▲", command=self._move_template_up, padx=8, pady=3)
         self.up_btn.pack(pady=(0, 3), fill="x")
         up_hover = OptimizedHoverEffect(self.up_btn, 'up', self.theme_manager)
         self.hover_effects.append(up_hover)
         
-        self.down_btn = Button(seq_button_frame, text="▼", command=self._move_template_down, **seq_button_style)
+        self.down_btn = Button(seq_button_frame, text="▼", command=self._move_template_down, padx=8, pady=3)
         self.down_btn.pack(fill="x")
         down_hover = OptimizedHoverEffect(self.down_btn, 'down', self.theme_manager)
         self.hover_effects.append(down_hover)
     
-    def _create_action_section(self, parent, styles):
+    def _create_action_section(self, parent):
         action_frame = Frame(parent, bg=self.theme_manager.get_color('bg_color'))
         action_frame.grid(row=4, column=0, sticky="ew", pady=(15, 0))
         
         self.create_button = Button(action_frame, text="Create Template", 
-                                   command=self._start_capture_mode, **styles['button'])
+                                   command=self._start_capture_mode)
         self.create_button.pack(side="left", expand=True, padx=(0, 8))
         create_hover = OptimizedHoverEffect(self.create_button, 'create', self.theme_manager)
         self.hover_effects.append(create_hover)
         
         self.start_button = Button(action_frame, text="Start (F3)", 
-                                  command=self._start_handler, **styles['button'])
+                                  command=self._start_handler)
         self.start_button.pack(side="left", expand=True)
         start_hover = OptimizedHoverEffect(self.start_button, 'start', self.theme_manager)
         self.hover_effects.append(start_hover)
     
-    def _create_status_section(self, parent, styles):
-        status_frame = Frame(parent, bg=self.theme_manager.get_color('bg_color'))
+    def _create_status_section(self, parent):
+        theme = self.theme_manager.current_theme
+        
+        status_frame = Frame(parent, bg=theme['bg_color'])
         status_frame.grid(row=5, column=0, sticky="ew", pady=(10,0))
         
         Label(status_frame, text="F3: Start/Resume | F4: Pause", 
-              bg=self.theme_manager.get_color('bg_color'), 
-              fg=self.theme_manager.get_color('secondary_fg_color'), 
-              font=("Segoe UI", 8)).pack(side="left")
+              bg=theme['bg_color'], 
+              fg=theme['secondary_fg_color'], 
+              font=self.font_small).pack(side="left")
         
         Label(status_frame, text=AppConstants.VERSION, 
-              bg=self.theme_manager.get_color('bg_color'), 
-              fg=self.theme_manager.get_color('secondary_fg_color'), 
-              font=("Segoe UI", 8)).pack(side="right")
+              bg=theme['bg_color'], 
+              fg=theme['secondary_fg_color'], 
+              font=self.font_small).pack(side="right")
 
     def _add_tooltips(self):
         tooltip_configs = [
@@ -433,6 +548,7 @@ class NexusAutoDL:
             (self.confidence_entry, "The accuracy required for a match (0.0 to 1.0).\nLower values are less strict. Requires OpenCV."),
             (self.min_sleep_entry, "The minimum time in seconds to wait between search cycles."),
             (self.max_sleep_entry, "The maximum time in seconds to wait between search cycles."),
+            (self.cooldown_entry, "Priority Mode only: skip a template for this many seconds\nafter it was found. 0 disables the cooldown."),
             (self.priority_radio, "Checks for templates one by one, in alphabetical order.\nIt clicks the first match it finds and then rests."),
             (self.sequence_radio, "Searches for templates one by one in the exact order\ndefined in the Sequence Editor."),
             (self.grayscale_check, "Searches for templates in black and white.\nThis is often faster but can be less accurate for some images."),
@@ -495,7 +611,6 @@ class NexusAutoDL:
             
             self._setup_ttk_style()
             
-            OptimizedHoverEffect.update_all_themes(self.theme_manager)
             EnhancedTooltip.update_all_themes(self.theme_manager)
             
             self._setup_ui()
@@ -522,7 +637,12 @@ class NexusAutoDL:
         return log_was_open
     
     def _toggle_feedback_options(self):
-        if self.show_visual_feedback.get(): 
+        show = bool(self.show_visual_feedback.get())
+        if show == self._feedback_frame_visible:
+            return
+        self._feedback_frame_visible = show
+        
+        if show: 
             self.feedback_options_frame.grid(row=2, column=0, columnspan=4, sticky='w', padx=(25, 0), pady=(8, 0))
             try:
                 current_color = self.feedback_color.get()
@@ -535,7 +655,13 @@ class NexusAutoDL:
     
     def _toggle_sequence_editor(self):
         self._populate_sequence_listbox()
-        if self.search_mode.get() == "sequence":
+        
+        show = self.search_mode.get() == "sequence"
+        if show == self._sequence_frame_visible:
+            return
+        self._sequence_frame_visible = show
+        
+        if show:
             self.sequence_frame.grid(row=3, column=0, sticky="ew", pady=10)
         else:
             self.sequence_frame.grid_forget()
@@ -553,27 +679,58 @@ class NexusAutoDL:
         except Exception as e:
             messagebox.showerror("Color Chooser Error", f"Could not open color chooser: {e}")
 
+    def _get_feedback_window(self) -> Tuple[Toplevel, Frame]:
+        # One hidden overlay is reused for every match; creating a Toplevel
+        # per hit costs a window-manager round-trip each time.
+        window = self._feedback_window
+        if window is None or self._feedback_frame is None or not window.winfo_exists():
+            window = Toplevel(self.root)
+            window.withdraw()
+            window.overrideredirect(True)
+            window.config(bg=AppConstants.TRANSPARENT_COLOR)
+            window.wm_attributes("-transparentcolor", AppConstants.TRANSPARENT_COLOR)
+            window.attributes("-topmost", True)
+            
+            border_frame = Frame(window, 
+                               highlightthickness=3, 
+                               bg=AppConstants.TRANSPARENT_COLOR)
+            border_frame.pack(fill="both", expand=True)
+            
+            self._feedback_window = window
+            self._feedback_frame = border_frame
+            self._feedback_frame_color = None
+        return window, self._feedback_frame
+    
     def _show_feedback_box(self, box):
         try:
-            feedback_window = Toplevel(self.root)
-            feedback_window.overrideredirect(True)
+            feedback_window, border_frame = self._get_feedback_window()
             feedback_window.geometry(f'{box.width}x{box.height}+{box.left}+{box.top}')
-            feedback_window.config(bg=AppConstants.TRANSPARENT_COLOR)
-            feedback_window.wm_attributes("-transparentcolor", AppConstants.TRANSPARENT_COLOR)
-            feedback_window.attributes("-topmost", True)
             
-            border_frame = Frame(feedback_window, 
-                               highlightbackground=self.feedback_color.get(), 
-                               highlightthickness=3, 
-                               bg=AppConstants.TRANSPARENT_COLOR)
-            border_frame.pack(fill="both", expand=True)
+            color = self.feedback_color.get()
+            if color != self._feedback_frame_color:
+                border_frame.config(highlightbackground=color)
+                self._feedback_frame_color = color
             
-            self.root.update_idletasks()
-            return feedback_window
+            feedback_window.deiconify()
+            feedback_window.lift()
+            self._feedback_shown_count += 1
+            
+            # No update_idletasks(): the click waits for feedback_duration via
+            # after(), so the event loop draws the overlay well before then.
+            return self._feedback_shown_count
         except Exception as e:
             print(f"Failed to create feedback box: {e}")
             return None
     
+    def _hide_feedback_box(self, token: int):
+        # A newer match may have moved the overlay in the meantime; leave it up.
+        if token != self._feedback_shown_count or self._feedback_window is None:
+            return
+        try:
+            self._feedback_window.withdraw()
+        except Exception:
+            pass
+    
     @safe_path_operation
     def _start_capture_mode(self):
         if not self.active_profile.get(): 
@@ -629,6 +786,13 @@ class NexusAutoDL:
             return self._monitors[idx - 1]
         return None
 
+    def _mss_grab_image(self, matcher: ScreenMatcher, region: Dict[str, int]) -> PILImageType:
+        if Image is None:
+            raise RuntimeError("Pillow is required for mss conversion")
+        sct_img = matcher.grab_raw(region)
+        # Decode BGRA straight into RGB instead of building mss's .rgb copy first.
+        return Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
+    
     def _capture_region_with_mss(self, region: Tuple[int, int, int, int]) -> PILImageType:
         region_dict = {
             "left": int(region[0]),
@@ -639,31 +803,22 @@ class NexusAutoDL:
 
         if MSS_AVAILABLE and mss is not None:
             try:
-                if Image is None:
-                    raise RuntimeError("Pillow is required for mss conversion")
-                with mss.mss() as sct:
-                    sct_img = sct.grab(region_dict)
-                return Image.frombytes("RGB", sct_img.size, sct_img.rgb)
+                return self._mss_grab_image(self.screen_matcher, region_dict)
             except Exception as e:
                 self._log(f"mss capture failed, falling back to pyautogui: {e}", "WARN")
 
-        return pyautogui.screenshot(region=region)
-
-    def _grab_monitor_screenshot(self) -> Tuple[PILImageType, int, int]:
-        monitor = self._get_selected_monitor_bounds()
+        return lazy_import("pyautogui").screenshot(region=region)
 
+    def _grab_monitor_screenshot(self, matcher: ScreenMatcher, 
+                                 monitor: Optional[Dict[str, int]]) -> Tuple[PILImageType, int, int]:
         if MSS_AVAILABLE and monitor and mss is not None:
             try:
-                if Image is None:
-                    raise RuntimeError("Pillow is required for mss conversion")
-                with mss.mss() as sct:
-                    sct_img = sct.grab(monitor)
-                image = Image.frombytes("RGB", sct_img.size, sct_img.rgb)
+                image = self._mss_grab_image(matcher, monitor)
                 return image, monitor.get("left", 0), monitor.get("top", 0)
             except Exception as e:
                 self._log(f"mss monitor capture failed, falling back: {e}", "WARN")
 
-        screenshot = pyautogui.screenshot()
+        screenshot = lazy_import("pyautogui").screenshot()
         return screenshot, 0, 0
 
     def _apply_screen_offset(self, box, offset_x: int, offset_y: int):
@@ -693,7 +848,7 @@ class NexusAutoDL:
     
     def _cancel_capture(self, event=None):
         try:
-            if hasattr(self, 'capture_window') and self.capture_window and self.capture_window.winfo_exists():
+            if self.capture_window and self.capture_window.winfo_exists():
                 self.capture_window.destroy()
                 self.capture_window = None
         except Exception:
@@ -768,7 +923,7 @@ class NexusAutoDL:
     @safe_path_operation
     def _save_captured_template(self, img):
         try:
-            profile_dir = Path(self.profiles_root_path.get()) / self.active_profile.get()
+            profile_dir = self.profiles_root / self.active_profile.get()
             profile_dir.mkdir(parents=True, exist_ok=True)
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -780,6 +935,7 @@ class NexusAutoDL:
                 counter += 1
             
             img.save(save_path, "PNG", optimize=True)
+            invalidate_dir_listing(profile_dir)
             
             self.template_cache.clear_cache()
             self._populate_sequence_listbox()
@@ -797,18 +953,38 @@ class NexusAutoDL:
         if not self.log_text_widget:
             return
         
-        try:
-            self.root.after_idle(self._write_log_message, message, level)
-        except Exception:
-            pass
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        line = f"[{timestamp}][{level}] {message}\n"
+        
+        if threading.current_thread() is not threading.main_thread():
+            self._match_queue.put(("log", None, (line,)))
+            return
+        
+        self._buffer_log_line(line)
     
-    def _write_log_message(self, message: str, level: str):
+    def _buffer_log_line(self, line: str):
+        self._log_buffer.append(line)
+        if self._log_flush_id is None:
+            try:
+                self._log_flush_id = self.root.after(AppConstants.LOG_FLUSH_INTERVAL, self._flush_log)
+            except Exception:
+                pass
+    
+    def _flush_log(self):
+        # Write everything logged since the last flush with a single state
+        # toggle and insert, rather than four Tcl calls per line.
+        self._log_flush_id = None
+        if not self._log_buffer:
+            return
+        
+        text = "".join(self._log_buffer)
+        self._log_buffer.clear()
+        
         if self.log_text_widget is None:
             return
         try:
             self.log_text_widget.config(state="normal")
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            self.log_text_widget.insert("end", f"[{timestamp}][{level}] {message}\n")
+            self.log_text_widget.insert("end", text)
             self.log_text_widget.see("end")
             self.log_text_widget.config(state="disabled")
         except Exception:
@@ -817,14 +993,20 @@ class NexusAutoDL:
     def _load_config(self):
         try:
             if Path(AppConstants.CONFIG_FILE).exists():
-                with open(AppConstants.CONFIG_FILE, "r", encoding='utf-8') as f: 
-                    self.config = json.load(f)
+                with open(AppConstants.CONFIG_FILE, "rb") as f: 
+                    self.config = load_json(f.read())
             else:
                 self.config = {}
         except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError) as e:
             print(f"Failed to load config: {e}")
             self.config = {}
         
+        # Every profile read and write goes through this one reference rather
+        # than walking self.config each time.
+        if not isinstance(self.config.get("profile_settings"), dict):
+            self.config["profile_settings"] = {}
+        self._profile_settings = self.config["profile_settings"]
+        
         self._load_validated_settings()
         self._load_profile_settings()
         self._last_active_profile = self.active_profile.get()
@@ -870,9 +1052,33 @@ class NexusAutoDL:
             self.monitor_number.set(1)
     
     def _save_config(self):
+        """
+        Records the current profile settings and schedules a config write, so
+        bursts of saves from the profile manager end up as a single write.
+        """
+        self._save_current_profile_settings()
+        self._config_dirty = True
+        
+        if self._config_flush_id is None:
+            self._config_flush_id = self.root.after(AppConstants.CONFIG_SAVE_DELAY, self._flush_config)
+    
+    def _flush_config(self, force: bool = False):
+        """
+        Writes the config if anything marked it dirty. force covers settings
+        that are only collected at exit, such as the theme and window options.
+        """
+        if self._config_flush_id is not None:
+            try:
+                self.root.after_cancel(self._config_flush_id)
+            except Exception:
+                pass
+            self._config_flush_id = None
+        
+        if not (force or self._config_dirty):
+            return
+        self._config_dirty = False
+        
         try:
-            self._save_current_profile_settings()
-            
             config_data = {
                 "dark_mode": self.dark_mode.get(),
                 "profiles_root_path": self.profiles_root_path.get(),
@@ -882,88 +1088,139 @@ class NexusAutoDL:
                 "feedback_color": self.feedback_color.get(),
                 "feedback_duration": self.feedback_duration.get(),
                 "monitor_number": self.monitor_number.get(),
-                "profile_settings": self.config.get("profile_settings", {})
+                "profile_settings": self._profile_settings
             }
             
+            serialized = dump_json(config_data)
+            if serialized == self._last_saved_config:
+                return
+            
             config_path = Path(AppConstants.CONFIG_FILE)
             temp_path = config_path.with_suffix('.tmp')
             
-            with open(temp_path, "w", encoding='utf-8') as f: 
-                json.dump(config_data, f, indent=4, ensure_ascii=False)
+            with open(temp_path, "wb") as f: 
+                f.write(serialized)
             
             temp_path.replace(config_path)
+            self._last_saved_config = serialized
             
         except Exception as e:
             print(f"Failed to save config: {e}")
     
     def _validate_inputs(self) -> bool:
+        if not self.active_profile.get(): 
+            messagebox.showerror("Invalid Setup", "No active profile selected. Please select or create a profile.")
+            return False
+        
         try:
-            if not self.active_profile.get(): 
-                messagebox.showerror("Invalid Setup", "No active profile selected. Please select or create a profile.")
-                return False
-            
             confidence = self.confidence.get()
-            if not (0.0 <= confidence <= 1.0):
-                messagebox.showerror("Invalid Input", 
-                                   f"Confidence must be between 0.0 and 1.0.\nCurrent value: {confidence}")
-                return False
-            
             min_sleep = self.min_sleep_seconds.get()
             max_sleep = self.max_sleep_seconds.get()
-            
-            if min_sleep < 0 or max_sleep < 0:
-                messagebox.showerror("Invalid Input", "Sleep values must be positive.")
-                return False
-            
-            if min_sleep > max_sleep:
-                messagebox.showerror("Invalid Input", 
-                                   f"Minimum sleep ({min_sleep}s) must be less than or equal to maximum sleep ({max_sleep}s).")
-                return False
-            
-            if max_sleep > 3600:
-                messagebox.showerror("Invalid Input", "Maximum sleep cannot exceed 3600 seconds (1 hour).")
-                return False
-            
+            cooldown = self.cooldown_seconds.get()
             duration = self.feedback_duration.get()
-            if duration < 100 or duration > 5000:
-                messagebox.showerror("Invalid Input", 
-                                   "Feedback duration must be between 100 and 5000 milliseconds.")
-                return False
-            
-            return True
-            
         except (ValueError, TypeError) as e:
             messagebox.showerror("Invalid Input", 
                                f"Please ensure all numeric fields contain valid numbers.\nError: {e}")
             return False
+        
+        # Collect every problem so the user sees them in one dialog instead of
+        # fixing them one Start attempt at a time.
+        errors: List[str] = []
+        
+        if not (0.0 <= confidence <= 1.0):
+            errors.append(f"Confidence must be between 0.0 and 1.0.\nCurrent value: {confidence}")
+        
+        if min_sleep < 0 or max_sleep < 0:
+            errors.append("Sleep values must be positive.")
+        elif min_sleep > max_sleep:
+            errors.append(f"Minimum sleep ({min_sleep}s) must be less than or equal to maximum sleep ({max_sleep}s).")
+        
+        if max_sleep > 3600:
+            errors.append("Maximum sleep cannot exceed 3600 seconds (1 hour).")
+        
+        if not (0.0 <= cooldown <= 3600):
+            errors.append("Cooldown must be between 0 and 3600 seconds.")
+        
+        if duration < 100 or duration > 5000:
+            errors.append("Feedback duration must be between 100 and 5000 milliseconds.")
+        
+        if errors:
+            messagebox.showerror("Invalid Input", "\n\n".join(errors))
+            return False
+        
+        return True
 
     def _on_key_press(self, key):
+        # The listener sees every keystroke system-wide, so unrelated keys are
+        # rejected with a single dict lookup.
+        action = self._hotkey_actions.get(key)
+        if action is None:
+            return
+        
         try:
-            if key == keyboard.Key.f3: 
-                self.root.after_idle(self._start_handler)
-            elif key == keyboard.Key.f4: 
-                self.root.after_idle(self._pause_handler)
-            elif key == keyboard.Key.esc and hasattr(self, 'capture_window') and self.capture_window:
-                self.root.after_idle(self._cancel_capture)
+            if action == self._cancel_capture and not self.capture_window:
+                return
+            
+            # Held keys auto-repeat; only act on the first press in a burst.
+            now = time.monotonic()
+            if now - self._last_key_times.get(key, 0.0) < AppConstants.HOTKEY_DEBOUNCE_SECONDS:
+                return
+            self._last_key_times[key] = now
+            
+            # Calling into Tk from this thread waits for the Tk thread to pick
+            # the call up, which would hold the system-wide key hook while the
+            # UI is busy. Actions go through a queue, and only the first one
+            # queued since the last drain starts a short-lived thread that
+            # posts the wake-up, so the hook returns at once and the Tk thread
+            # never has to poll for hotkeys.
+            self._hotkey_queue.put(action)
+            if not self._hotkey_wake_pending.is_set():
+                self._hotkey_wake_pending.set()
+                threading.Thread(target=self._post_hotkey_wake, daemon=True).start()
         except Exception as e:
+            self._hotkey_wake_pending.clear()
             print(f"Keyboard event error: {e}")
     
+    def _post_hotkey_wake(self):
+        try:
+            self.root.event_generate("<<Hotkey>>", when="tail")
+        except Exception as e:
+            # Without this, every later hotkey would wait on a wake-up that
+            # never comes.
+            self._hotkey_wake_pending.clear()
+            print(f"Hotkey wake-up error: {e}")
+    
+    def _drain_hotkeys(self, event=None):
+        # Cleared before draining: an action queued after this point posts
+        # its own wake-up instead of being left behind.
+        self._hotkey_wake_pending.clear()
+        while True:
+            try:
+                action = self._hotkey_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                action()
+            except Exception as e:
+                print(f"Hotkey action error: {e}")
+    
     @safe_path_operation
     def get_profiles(self) -> List[str]:
         try:
-            root_path = Path(self.profiles_root_path.get())
-            if not root_path.is_dir(): 
-                return []
-            
-            profiles = [
-                d.name for d in root_path.iterdir() 
-                if d.is_dir() and not d.name.startswith('.')
-            ]
-            return sorted(profiles)
+            return cached_dir_listing(self.profiles_root, self._scan_profiles)
+        except (FileNotFoundError, NotADirectoryError):
+            return []
         except Exception as e:
             print(f"Error getting profiles: {e}")
             return []
     
+    @staticmethod
+    def _scan_profiles(root_path: str) -> List[str]:
+        # DirEntry caches the type from the directory listing, so this does
+        # not stat every entry a second time like Path.is_dir() would.
+        with os.scandir(root_path) as it:
+            return sorted(e.name for e in it if not e.name.startswith('.') and e.is_dir())
+    
     def _update_profile_list(self):
         try:
             profiles = self.get_profiles()
@@ -988,7 +1245,13 @@ class NexusAutoDL:
             if self._last_active_profile and self._last_active_profile != self.active_profile.get():
                 self._save_current_profile_settings()
             
+            self._flush_template_cache(self._last_active_profile)
             self.template_cache.clear_cache()
+            
+            cache_file = self._get_template_cache_file(self.active_profile.get())
+            if cache_file:
+                self.template_cache.load_from_disk(cache_file)
+            
             self._load_profile_settings()
             self._populate_sequence_listbox()
             self._last_active_profile = self.active_profile.get()
@@ -997,37 +1260,68 @@ class NexusAutoDL:
     
     def _populate_sequence_listbox(self):
         try:
-            self.sequence_listbox.delete(0, 'end')
-            
-            profile_name = self.active_profile.get()
-            if not profile_name: 
-                return
-            
-            profile_path = Path(self.profiles_root_path.get()) / profile_name
-            if not profile_path.is_dir(): 
-                return
-            
-            actual_files = {
-                p.name for p in profile_path.iterdir() 
-                if p.is_file() and p.suffix.lower() in AppConstants.SUPPORTED_IMAGE_EXTENSIONS
-            }
-            
-            if not actual_files:
-                return
-            
-            profile_settings = self.config.get("profile_settings", {}).get(profile_name, {})
-            saved_sequence = profile_settings.get("sequence", [])
-            
-            final_sequence = [f for f in saved_sequence if f in actual_files]
-            new_files = sorted(actual_files - set(final_sequence), key=str.lower)
-            final_sequence.extend(new_files)
-            
-            for item in final_sequence: 
-                self.sequence_listbox.insert('end', item)
-                
+            self._sync_sequence_listbox(self._build_sequence_order())
         except Exception as e:
             print(f"Error populating sequence listbox: {e}")
     
+    def _build_sequence_order(self) -> List[str]:
+        profile_name = self.active_profile.get()
+        if not profile_name: 
+            return []
+        
+        # scandir reports a missing folder itself, so there is no separate
+        # is_dir() stat; the plain string join skips building a Path.
+        extensions = AppConstants.SUPPORTED_IMAGE_EXTENSIONS
+        try:
+            with os.scandir(os.path.join(self.profiles_root, profile_name)) as it:
+                actual_files = {
+                    e.name for e in it 
+                    if os.path.splitext(e.name)[1].lower() in extensions
+                    and e.is_file(follow_symlinks=False)
+                }
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+        
+        if not actual_files:
+            return []
+        
+        profile_settings = self._profile_settings.get(profile_name, {})
+        saved_sequence = profile_settings.get("sequence", [])
+        
+        final_sequence = [f for f in saved_sequence if f in actual_files]
+        new_files = sorted(actual_files - set(final_sequence), key=str.lower)
+        final_sequence.extend(new_files)
+        return final_sequence
+    
+    def _sync_sequence_listbox(self, new_order: List[str]):
+        """
+        Brings the listbox in line with new_order, only deleting and inserting
+        the rows between the common prefix and suffix of the old order.
+        """
+        old_order = self._sequence_order
+        if new_order == old_order:
+            return
+        
+        limit = min(len(old_order), len(new_order))
+        prefix = 0
+        while prefix < limit and old_order[prefix] == new_order[prefix]:
+            prefix += 1
+        
+        limit -= prefix
+        suffix = 0
+        while suffix < limit and old_order[-1 - suffix] == new_order[-1 - suffix]:
+            suffix += 1
+        
+        old_end = len(old_order) - suffix
+        if old_end > prefix:
+            self.sequence_listbox.delete(prefix, old_end - 1)
+        
+        changed = new_order[prefix:len(new_order) - suffix]
+        if changed:
+            self.sequence_listbox.insert(prefix, *changed)
+        
+        self._sequence_order = new_order
+    
     def _move_template_up(self):
         try:
             selected_indices = self.sequence_listbox.curselection()
@@ -1039,6 +1333,8 @@ class NexusAutoDL:
                 item = self.sequence_listbox.get(idx)
                 self.sequence_listbox.delete(idx)
                 self.sequence_listbox.insert(idx - 1, item)
+                order = self._sequence_order
+                order[idx - 1], order[idx] = order[idx], order[idx - 1]
                 self.sequence_listbox.selection_set(idx - 1)
                 self.sequence_listbox.activate(idx - 1)
         except Exception as e:
@@ -1055,6 +1351,8 @@ class NexusAutoDL:
                 item = self.sequence_listbox.get(idx)
                 self.sequence_listbox.delete(idx)
                 self.sequence_listbox.insert(idx + 1, item)
+                order = self._sequence_order
+                order[idx + 1], order[idx] = order[idx], order[idx + 1]
                 self.sequence_listbox.selection_set(idx + 1)
                 self.sequence_listbox.activate(idx + 1)
         except Exception as e:
@@ -1083,7 +1381,7 @@ class NexusAutoDL:
                 )
                 return
             
-            root_path = Path(self.profiles_root_path.get())
+            root_path = self.profiles_root
             root_path.mkdir(exist_ok=True)
             new_profile_path = root_path / new_profile_name
             
@@ -1096,6 +1394,7 @@ class NexusAutoDL:
                 return
             
             new_profile_path.mkdir(parents=True, exist_ok=True)
+            invalidate_dir_listing(root_path)
             
             self.active_profile.set(new_profile_name)
             self._update_profile_list()
@@ -1144,8 +1443,6 @@ class NexusAutoDL:
                 text="Running...",
                 bg=self.theme_manager.get_color('button_active_bg_color')
             )
-            self.sequence_index = 0
-            
             if self.log_window is None: 
                 self._show_log_window()
             
@@ -1154,7 +1451,7 @@ class NexusAutoDL:
             if self.log_window: 
                 self.root.withdraw()
             
-            self._match_loop()
+            self._start_match_worker()
             
         except Exception as e:
             self._handle_start_error(e)
@@ -1174,10 +1471,7 @@ class NexusAutoDL:
         
         try:
             self._is_running = False
-            
-            if self._after_id: 
-                self.root.after_cancel(self._after_id)
-                self._after_id = None
+            self._match_stop.set()
             
             self.start_button.config(
                 state="normal", 
@@ -1195,36 +1489,49 @@ class NexusAutoDL:
     
     def _load_templates(self):
         try:
-            self.templates.clear()
-            
-            profile_path = Path(self.profiles_root_path.get()) / self.active_profile.get()
-            if not profile_path.is_dir(): 
+            # Rebind rather than clear: a worker still finishing its last tick
+            # keeps reading the dictionaries it was started with.
+            self.templates = {}
+            self._template_arrays = {}
+            self._priority_order = ()
+            
+            profile_path = os.path.join(self.profiles_root, self.active_profile.get())
+            extensions = AppConstants.SUPPORTED_IMAGE_EXTENSIONS
+            try:
+                with os.scandir(profile_path) as it:
+                    all_template_files = [
+                        Path(e.path) for e in it 
+                        if os.path.splitext(e.name)[1].lower() in extensions
+                        and e.is_file(follow_symlinks=False)
+                    ]
+            except (FileNotFoundError, NotADirectoryError):
                 self._log(f"Profile directory not found: {profile_path}", "ERROR")
                 return
             
-            all_template_files = [
-                p for p in profile_path.iterdir() 
-                if p.is_file() and p.suffix.lower() in AppConstants.SUPPORTED_IMAGE_EXTENSIONS
-            ]
-            
             if not all_template_files:
                 self._log(f"No template files found in profile '{self.active_profile.get()}'", "WARN")
                 return
             
-            all_template_files.sort(key=human_sort_key)
-            
             loaded_count = 0
             failed_count = 0
+            has_cv2 = is_module_importable("cv2")
             
             for path in all_template_files:
-                template = self.template_cache.get_template(path)
-                if template:
-                    self.templates[path.name] = template
+                # pyautogui's fallback without OpenCV needs PIL images; otherwise
+                # the shared arrays stand in and no pixel copy is made.
+                cached = self.template_cache.get_template_with_arrays(path, copy_image=not has_cv2)
+                if cached:
+                    template, bgr, gray = cached
+                    self.templates[path.name] = template if template is not None else bgr
+                    if has_cv2 and bgr is not None:
+                        self._template_arrays[path.name] = (bgr, gray)
                     loaded_count += 1
                 else:
                     failed_count += 1
                     self._log(f"Failed to load template: {path.name}", "WARN")
             
+            self._priority_order = tuple(sorted(self.templates, key=str.lower))
+            
             self._log(f"Loaded {loaded_count} templates for profile '{self.active_profile.get()}'")
             if failed_count > 0:
                 self._log(f"Failed to load {failed_count} templates", "WARN")
@@ -1234,35 +1541,154 @@ class NexusAutoDL:
                 self._log(f"Cache: {stats['cache_size']}/{stats['max_size']} "
                          f"(Hit rate: {stats['hit_rate']:.1f}%, "
                          f"Memory: {stats['memory_usage_bytes'] // 1024} KB)")
+                self._schedule_template_cache_flush()
             
         except Exception as e:
             self._log(f"Error loading templates: {e}", "ERROR")
     
-    def _match_loop(self):
-        if not self._is_running: 
+    def _get_template_cache_file(self, profile_name: str) -> Optional[Path]:
+        if not profile_name:
+            return None
+        return self.profiles_root / profile_name / AppConstants.TEMPLATE_CACHE_FILE
+    
+    def _schedule_template_cache_flush(self):
+        if not self.template_cache.is_dirty:
             return
         
+        if self._cache_flush_id:
+            self.root.after_cancel(self._cache_flush_id)
+        self._cache_flush_id = self.root.after(
+            AppConstants.TEMPLATE_CACHE_FLUSH_DELAY,
+            self._flush_template_cache
+        )
+    
+    def _flush_template_cache(self, profile_name: Optional[str] = None):
+        if self._cache_flush_id:
+            try:
+                self.root.after_cancel(self._cache_flush_id)
+            except Exception:
+                pass
+            self._cache_flush_id = None
+        
+        if not self.template_cache.is_dirty:
+            return
+        
+        if profile_name is None:
+            profile_name = self.active_profile.get()
+        if profile_name in self._profiles_being_deleted:
+            return
+        
+        cache_file = self._get_template_cache_file(profile_name)
+        if cache_file and cache_file.parent.is_dir():
+            self.template_cache.save_to_disk(cache_file)
+    
+    def _start_match_worker(self):
+        self._match_stop.set()
+        self._match_stop = threading.Event()
+        self._match_run_id += 1
+        
+        grayscale = bool(self.grayscale.get())
+        confidence = float(self.confidence.get())
+        
+        # Only pyautogui's fallback path needs these as keyword arguments, and
+        # it only accepts a confidence when its OpenCV backend is present.
+        search_kwargs: Dict[str, object] = {"grayscale": grayscale}
+        if is_module_importable("cv2"): 
+            search_kwargs["confidence"] = confidence
+        
+        settings = MatchSettings(
+            run_id=self._match_run_id,
+            stop=self._match_stop,
+            profile_name=self.active_profile.get(),
+            monitor=self._get_selected_monitor_bounds(),
+            search_mode=self.search_mode.get(),
+            grayscale=grayscale,
+            confidence=confidence,
+            search_kwargs=search_kwargs,
+            min_sleep=self.min_sleep_seconds.get(),
+            max_sleep=self.max_sleep_seconds.get(),
+            cooldown=self.cooldown_seconds.get(),
+            priority_targets=self._compile_match_targets(self._priority_order, grayscale),
+            sequence_targets=self._compile_match_targets(self._sequence_order, grayscale)
+        )
+        
+        self._match_thread = threading.Thread(
+            target=self._match_worker, args=(settings,), name="MatchWorker", daemon=True
+        )
+        self._match_thread.start()
+        
+        # A poll scheduled around the previous run's sleep could be far off.
+        if self._queue_poll_id is not None:
+            self.root.after_cancel(self._queue_poll_id)
+        self._drain_match_queue()
+    
+    def _match_worker(self, settings: MatchSettings):
+        # mss handles are bound to the thread that created them, so the worker
+        # captures through its own matcher rather than self.screen_matcher.
+        # Frames are grabbed at the start of each tick rather than prefetched:
+        # a frame captured before the sleep would be seconds old by the time
+        # it was matched and clicked on.
+        matcher = ScreenMatcher()
+        sequence_index = 0
+        cooldowns: Dict[str, float] = {}
+        
         try:
-            self._perform_match()
-            
-            sleep_interval = random.uniform(
-                self.min_sleep_seconds.get(), 
-                self.max_sleep_seconds.get()
-            )
-            
-            self._log(f"Waiting for {sleep_interval:.2f} seconds.")
-            
-            self._after_id = self.root.after(
-                int(sleep_interval * 1000), 
-                self._match_loop
-            )
+            while not settings.stop.is_set():
+                sequence_index = self._perform_match(matcher, settings, sequence_index, cooldowns)
+                if settings.stop.is_set():
+                    break
+                
+                sleep_interval = random.uniform(settings.min_sleep, settings.max_sleep)
+                
+                self._log(f"Waiting for {sleep_interval:.2f} seconds.")
+                
+                self._match_idle_until = (settings.run_id, time.monotonic() + sleep_interval)
+                settings.stop.wait(sleep_interval)
             
         except Exception as e:
             self._log(f"Error in match loop: {e}", "ERROR")
-            self._pause_handler()
+            self._request_pause(settings)
+        finally:
+            matcher.close()
+    
+    def _request_pause(self, settings: MatchSettings):
+        settings.stop.set()
+        self._match_queue.put(("pause", settings.run_id, ()))
+    
+    def _drain_match_queue(self):
+        self._queue_poll_id = None
+        
+        try:
+            while True:
+                event, run_id, payload = self._match_queue.get_nowait()
+                if event == "log":
+                    self._buffer_log_line(*payload)
+                elif run_id == self._match_run_id and self._is_running:
+                    if event == "found":
+                        self._handle_found_match(*payload)
+                    elif event == "pause":
+                        self._pause_handler()
+        except queue.Empty:
+            pass
+        
+        worker_alive = self._match_thread is not None and self._match_thread.is_alive()
+        if self._is_running or worker_alive:
+            # Nothing can arrive while the worker sleeps between ticks, so the
+            # next poll waits for it to wake instead of firing every interval.
+            delay = AppConstants.MATCH_QUEUE_POLL_INTERVAL
+            idle_run_id, idle_until = self._match_idle_until
+            if idle_run_id == self._match_run_id and self._is_running:
+                delay = max(delay, int((idle_until - time.monotonic()) * 1000))
+                # The worker queues a match before it records its sleep, so an
+                # event may have landed after the drain above; pick it up now
+                # rather than a whole sleep interval late.
+                if not self._match_queue.empty():
+                    delay = AppConstants.MATCH_QUEUE_POLL_INTERVAL
+            self._queue_poll_id = self.root.after(delay, self._drain_match_queue)
     
     def _perform_click_action(self, box, path_name: str):
         try:
+            pyautogui = lazy_import("pyautogui")
             center_x, center_y = pyautogui.center(box)
             
             click_x = center_x + random.randint(-AppConstants.CLICK_TOLERANCE, AppConstants.CLICK_TOLERANCE)
@@ -1270,53 +1696,155 @@ class NexusAutoDL:
             
             original_pos = pyautogui.position()
             
-            pyautogui.click(click_x, click_y)
+            # _pause=False skips pyautogui's default 0.1s sleep after each call,
+            # which otherwise blocks the Tk thread for 0.2s on every click.
+            pyautogui.click(click_x, click_y, _pause=False)
             
-            pyautogui.moveTo(original_pos)
+            pyautogui.moveTo(original_pos, _pause=False)
             
             self._log(f"Clicked '{path_name}' at ({click_x}, {click_y})")
             
         except Exception as e:
             self._log(f"Error clicking '{path_name}': {e}", "ERROR")
     
-    def _perform_match(self):
+    def _compile_match_targets(self, names, grayscale: bool) -> Tuple[MatchTarget, ...]:
+        """
+        Resolves template names to the needles the matcher will use, once per
+        run, so each tick indexes into a tuple instead of looking names up.
+        A name without a loaded template gets a None needle.
+        """
+        # Templates without cached arrays, which is all of them without OpenCV,
+        # are converted here rather than by the matcher on every tick. The
+        # pyautogui fallback still needs the PIL images.
+        can_match = ScreenMatcher.can_match()
+        converted: Dict[str, Any] = {}
+        targets = []
+        for name in names:
+            needle = self.templates.get(name)
+            arrays = self._template_arrays.get(name)
+            array = (arrays[1] if grayscale else arrays[0]) if arrays else None
+            if array is not None:
+                needle = array
+            elif needle is not None and can_match:
+                if name not in converted:
+                    converted[name] = self.screen_matcher.as_needle(needle, grayscale)
+                needle = converted[name]
+            targets.append(MatchTarget(name, needle))
+        
+        if can_match and targets:
+            return self._pack_needles(targets)
+        return tuple(targets)
+    
+    @staticmethod
+    def _pack_needles(targets: List[MatchTarget]) -> Tuple[MatchTarget, ...]:
+        """
+        Copies the array needles into one contiguous arena and swaps in views
+        of it, so a tick walks its templates through sequential memory rather
+        than separately allocated arrays. A template listed more than once
+        shares a single view.
+        """
+        np = lazy_import("numpy")
+        unique: Dict[int, Any] = {}
+        for target in targets:
+            if isinstance(target.needle, np.ndarray):
+                unique.setdefault(id(target.needle), target.needle)
+        if not unique:
+            return tuple(targets)
+        
+        arena = np.empty(sum(array.nbytes for array in unique.values()), dtype=np.uint8)
+        views: Dict[int, Any] = {}
+        offset = 0
+        for key, array in unique.items():
+            view = arena[offset:offset + array.nbytes].reshape(array.shape)
+            view[...] = array
+            view.flags.writeable = False
+            views[key] = view
+            offset += array.nbytes
+        
+        return tuple(
+            target._replace(needle=views[id(target.needle)]) if id(target.needle) in views else target
+            for target in targets
+        )
+    
+    def _capture_frame(self, matcher: ScreenMatcher, 
+                       monitor: Optional[Dict[str, int]]) -> Tuple[Optional[PILImageType], int, int]:
+        """
+        Grabs the screen for a match tick. Returns None instead of a PIL image
+        when the frame lives in the matcher's buffers.
+        """
+        if monitor and matcher.is_available():
+            try:
+                matcher.grab(monitor)
+                return None, monitor.get("left", 0), monitor.get("top", 0)
+            except Exception as e:
+                self._log(f"Direct capture failed, falling back: {e}", "WARN")
+        
+        screenshot, offset_x, offset_y = self._grab_monitor_screenshot(matcher, monitor)
+        
+        # pyautogui.locate would re-convert the screenshot for every template;
+        # convert it once and let all templates share it.
+        if matcher.can_match():
+            try:
+                matcher.set_frame(screenshot)
+                return None, offset_x, offset_y
+            except Exception as e:
+                self._log(f"Frame conversion failed, using pyautogui: {e}", "WARN")
+        
+        return screenshot, offset_x, offset_y
+    
+    def _locate_template(self, matcher: ScreenMatcher, settings: MatchSettings, 
+                         target: MatchTarget, screenshot):
+        if screenshot is None:
+            return matcher.locate(target.needle, settings.grayscale, settings.confidence, key=target.name)
+        return lazy_import("pyautogui").locate(target.needle, screenshot, **settings.search_kwargs)
+    
+    def _perform_match(self, matcher: ScreenMatcher, settings: MatchSettings, sequence_index: int, 
+                       cooldowns: Dict[str, float]) -> int:
+        """
+        Runs one match tick on the worker thread and returns the sequence index
+        for the next tick.
+        """
         try:
-            if not self.templates:
-                self._log(f"No templates loaded for profile '{self.active_profile.get()}'. Pausing.", "WARN")
-                self._pause_handler()
-                return
+            if not settings.priority_targets:
+                self._log(f"No templates loaded for profile '{settings.profile_name}'. Pausing.", "WARN")
+                self._request_pause(settings)
+                return sequence_index
             
-            screenshot, offset_x, offset_y = self._grab_monitor_screenshot()
+            screenshot, offset_x, offset_y = self._capture_frame(matcher, settings.monitor)
             
-            if self.search_mode.get() == "sequence": 
-                self._perform_match_sequence(screenshot, offset_x, offset_y)
-            else: 
-                self._perform_match_priority(screenshot, offset_x, offset_y)
+            if settings.search_mode == "sequence": 
+                return self._perform_match_sequence(
+                    matcher, settings, sequence_index, screenshot, offset_x, offset_y
+                )
+            self._perform_match_priority(matcher, settings, screenshot, offset_x, offset_y, cooldowns)
                 
         except Exception as e:
             self._log(f"Screenshot error: {e}. Retrying...", "WARN")
+        return sequence_index
     
-    def _perform_match_priority(self, screenshot, offset_x: int, offset_y: int):
+    def _perform_match_priority(self, matcher: ScreenMatcher, settings: MatchSettings, 
+                                screenshot, offset_x: int, offset_y: int, cooldowns: Dict[str, float]):
+        # A template that was just clicked is skipped without being searched
+        # until its cooldown deadline passes.
         try:
-            search_kwargs: Dict[str, object] = {"grayscale": bool(self.grayscale.get())}
-            if HAS_CV2: 
-                search_kwargs["confidence"] = float(self.confidence.get())
-            
-            sorted_template_names = sorted(self.templates.keys(), key=str.lower)
+            pyautogui = lazy_import("pyautogui")
             
-            for name in sorted_template_names:
-                image = self.templates.get(name)
-                if not image: 
+            now = time.monotonic()
+            for target in settings.priority_targets:
+                name = target.name
+                if now < cooldowns.get(name, 0.0):
                     continue
                 
                 self._log(f"Searching for template: {name}")
                 
                 try:
-                    box = pyautogui.locate(image, screenshot, **search_kwargs)
+                    box = self._locate_template(matcher, settings, target, screenshot)
                     if box: 
                         adjusted_box = self._apply_screen_offset(box, offset_x, offset_y)
                         self._log(f"Found match: {name}")
-                        self._handle_found_match(adjusted_box, name)
+                        if settings.cooldown > 0:
+                            cooldowns[name] = now + settings.cooldown
+                        self._match_queue.put(("found", settings.run_id, (adjusted_box, name)))
                         return
                         
                 except pyautogui.PyAutoGUIException as e: 
@@ -1329,36 +1857,34 @@ class NexusAutoDL:
         except Exception as e:
             self._log(f"Error in priority match: {e}", "ERROR")
     
-    def _perform_match_sequence(self, screenshot, offset_x: int, offset_y: int):
+    def _perform_match_sequence(self, matcher: ScreenMatcher, settings: MatchSettings, sequence_index: int, 
+                                screenshot, offset_x: int, offset_y: int) -> int:
         try:
-            sequence = list(self.sequence_listbox.get(0, 'end'))
+            pyautogui = lazy_import("pyautogui")
+            sequence = settings.sequence_targets
             if not sequence: 
                 self._log("Sequence is empty. Pausing.", "WARN")
-                self._pause_handler()
-                return
+                self._request_pause(settings)
+                return sequence_index
             
-            self.sequence_index %= len(sequence)
-            target_name = sequence[self.sequence_index]
+            sequence_index %= len(sequence)
+            target = sequence[sequence_index]
+            target_name = target.name
             
-            image_to_find = self.templates.get(target_name)
-            if not image_to_find: 
+            if target.needle is None: 
                 self._log(f"Template '{target_name}' for sequence step not found in memory. Pausing.", "ERROR")
-                self._pause_handler()
-                return
+                self._request_pause(settings)
+                return sequence_index
             
-            self._log(f"Searching for sequence step {self.sequence_index + 1}/{len(sequence)}: '{target_name}'")
-            
-            search_kwargs: Dict[str, object] = {"grayscale": bool(self.grayscale.get())}
-            if HAS_CV2: 
-                search_kwargs["confidence"] = float(self.confidence.get())
+            self._log(f"Searching for sequence step {sequence_index + 1}/{len(sequence)}: '{target_name}'")
             
             try:
-                box = pyautogui.locate(image_to_find, screenshot, **search_kwargs)
+                box = self._locate_template(matcher, settings, target, screenshot)
                 if box:
                     adjusted_box = self._apply_screen_offset(box, offset_x, offset_y)
                     self._log(f"Found sequence match: {target_name}")
-                    self.sequence_index = (self.sequence_index + 1) % len(sequence)
-                    self._handle_found_match(adjusted_box, target_name)
+                    sequence_index = (sequence_index + 1) % len(sequence)
+                    self._match_queue.put(("found", settings.run_id, (adjusted_box, target_name)))
                 else:
                     self._log(f"Sequence step '{target_name}' not found, waiting...")
                     
@@ -1369,6 +1895,7 @@ class NexusAutoDL:
                 
         except Exception as e:
             self._log(f"Error in sequence match: {e}", "ERROR")
+        return sequence_index
     
     def _handle_found_match(self, box, path_name: str):
         try:
@@ -1390,7 +1917,7 @@ class NexusAutoDL:
     def _execute_delayed_click(self, feedback_box, box, path_name: str):
         try:
             if feedback_box:
-                feedback_box.destroy()
+                self._hide_feedback_box(feedback_box)
             
             self._perform_click_action(box, path_name)
             
@@ -1399,39 +1926,40 @@ class NexusAutoDL:
     
     def _show_log_window(self):
         try:
+            theme = self.theme_manager.current_theme
             self.root.withdraw()
             
             self.log_window = Toplevel(self.root)
             self.log_window.title("Automation Log Console")
             self.log_window.protocol("WM_DELETE_WINDOW", self._terminate_app)
-            self.log_window.config(bg=self.theme_manager.get_color('bg_color'))
+            self.log_window.config(bg=theme['bg_color'])
             
             width, height = map(int, AppConstants.LOG_WINDOW_SIZE.split('x'))
             self.log_window.geometry(f"{width}x{height}")
             
             self._update_always_on_top()
             
-            main_log_frame = Frame(self.log_window, bg=self.theme_manager.get_color('bg_color'))
+            main_log_frame = Frame(self.log_window, bg=theme['bg_color'])
             main_log_frame.pack(padx=10, pady=10, fill="both", expand=True)
             
             help_label = Label(
                 main_log_frame, 
                 text="F3: Resume | F4: Pause & Show Settings", 
-                bg=self.theme_manager.get_color('bg_color'), 
-                fg=self.theme_manager.get_color('secondary_fg_color'), 
-                font=("Segoe UI", 9)
+                bg=theme['bg_color'], 
+                fg=theme['secondary_fg_color'], 
+                font=self.font_body
             )
             help_label.pack(pady=(0, 5))
             
-            text_frame = Frame(main_log_frame, bg=self.theme_manager.get_color('bg_color'))
+            text_frame = Frame(main_log_frame, bg=theme['bg_color'])
             text_frame.pack(fill="both", expand=True)
             
             self.log_text_widget = Text(
                 text_frame, 
                 height=15, width=80, wrap="word", 
-                bg=self.theme_manager.get_color('input_bg_color'), 
-                fg=self.theme_manager.get_color('input_fg_color'), 
-                bd=0, highlightthickness=0, font=("Consolas", 9),
+                bg=theme['input_bg_color'], 
+                fg=theme['input_fg_color'], 
+                bd=0, highlightthickness=0, font=self.font_mono,
                 state="disabled"
             )
             self.log_text_widget.pack(side="left", fill="both", expand=True)
@@ -1439,10 +1967,10 @@ class NexusAutoDL:
             scrollbar = Scrollbar(
                 text_frame, 
                 command=self.log_text_widget.yview, 
-                bg=self.theme_manager.get_color('bg_color'), 
-                troughcolor=self.theme_manager.get_color('input_bg_color'), 
+                bg=theme['bg_color'], 
+                troughcolor=theme['input_bg_color'], 
                 bd=0, 
-                activebackground=self.theme_manager.get_color('selection_bg_color')
+                activebackground=theme['selection_bg_color']
             )
             scrollbar.pack(side="right", fill="y")
             self.log_text_widget.config(yscrollcommand=scrollbar.set)
@@ -1450,7 +1978,7 @@ class NexusAutoDL:
             self._log(f"Automation started - Profile: '{self.active_profile.get()}' | Mode: '{self.search_mode.get()}'")
             self._log(f"Templates loaded: {len(self.templates)}")
             
-            if not HAS_CV2:
+            if not is_module_importable("cv2"):
                 self._log("Note: OpenCV not installed. Confidence setting will be ignored. "
                          "Install with: pip install opencv-python", "WARN")
             if not MSS_AVAILABLE:
@@ -1461,12 +1989,14 @@ class NexusAutoDL:
     
     def _terminate_app(self):
         try:
-            self._save_config()
+            self._save_current_profile_settings()
+            self._flush_config(force=True)
             
             self._is_running = False
-            if self._after_id: 
-                self.root.after_cancel(self._after_id)
-                self._after_id = None
+            self._match_stop.set()
+            if self._queue_poll_id: 
+                self.root.after_cancel(self._queue_poll_id)
+                self._queue_poll_id = None
             
             if hasattr(self, 'keyboard_listener') and self.keyboard_listener:
                 try:
@@ -1474,8 +2004,12 @@ class NexusAutoDL:
                 except Exception:
                     pass
             
+            self._flush_template_cache()
             self.templates.clear()
+            self._template_arrays.clear()
+            self._priority_order = ()
             self.template_cache.clear_cache()
+            self.screen_matcher.close()
             
             EnhancedTooltip.hide_all()
             
@@ -1490,48 +2024,68 @@ class NexusAutoDL:
             except:
                 pass
     
+    @staticmethod
+    def _parse_profile_options(raw: Dict[str, Any]) -> ProfileOptions:
+        defaults = ProfileOptions()
+        
+        def number(key: str, default: float, upper: float) -> float:
+            value = raw.get(key, default)
+            if isinstance(value, (int, float)) and 0.0 <= value <= upper:
+                return float(value)
+            return default
+        
+        search_mode = raw.get("search_mode", defaults.search_mode)
+        return ProfileOptions(
+            confidence=number("confidence", defaults.confidence, 1.0),
+            grayscale=bool(raw.get("grayscale", defaults.grayscale)),
+            min_sleep=number("min_sleep", defaults.min_sleep, 3600),
+            max_sleep=number("max_sleep", defaults.max_sleep, 3600),
+            cooldown=number("cooldown", defaults.cooldown, 3600),
+            search_mode=search_mode if search_mode in ("priority", "sequence") else defaults.search_mode
+        )
+    
+    def _get_profile_options(self, profile_name: str) -> ProfileOptions:
+        """
+        Returns the validated settings of a profile. Parses are cached against
+        the stored dict itself, which saving replaces, so they never go stale.
+        """
+        raw = self._profile_settings.get(profile_name) if profile_name else None
+        if not isinstance(raw, dict):
+            return ProfileOptions()
+        
+        cached = self._profile_options_cache.get(profile_name)
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        
+        options = self._parse_profile_options(raw)
+        self._profile_options_cache[profile_name] = (raw, options)
+        return options
+    
+    @staticmethod
+    def _set_if_changed(variable, value):
+        # Writing an unchanged value still goes through Tcl and redraws every
+        # widget bound to the variable.
+        try:
+            if variable.get() == value:
+                return
+        except (TclError, ValueError):
+            pass
+        variable.set(value)
+    
+    def _apply_profile_options(self, options: ProfileOptions):
+        self._set_if_changed(self.confidence, options.confidence)
+        self._set_if_changed(self.grayscale, options.grayscale)
+        self._set_if_changed(self.min_sleep_seconds, options.min_sleep)
+        self._set_if_changed(self.max_sleep_seconds, options.max_sleep)
+        self._set_if_changed(self.cooldown_seconds, options.cooldown)
+        self._set_if_changed(self.search_mode, options.search_mode)
+    
     def _load_profile_settings(self):
         try:
-            profile_name = self.active_profile.get()
-            if not profile_name:
-                profile_settings = {}
-            else:
-                all_profile_settings = self.config.get("profile_settings", {})
-                profile_settings = all_profile_settings.get(profile_name, {})
-            
-            confidence = profile_settings.get("confidence", 0.8)
-            if isinstance(confidence, (int, float)) and 0.0 <= confidence <= 1.0:
-                self.confidence.set(float(confidence))
-            else:
-                self.confidence.set(0.8)
-            
-            self.grayscale.set(bool(profile_settings.get("grayscale", True)))
-            
-            min_sleep = profile_settings.get("min_sleep", 1.0)
-            if isinstance(min_sleep, (int, float)) and 0.0 <= min_sleep <= 3600:
-                self.min_sleep_seconds.set(float(min_sleep))
-            else:
-                self.min_sleep_seconds.set(1.0)
-            
-            max_sleep = profile_settings.get("max_sleep", 5.0)
-            if isinstance(max_sleep, (int, float)) and 0.0 <= max_sleep <= 3600:
-                self.max_sleep_seconds.set(float(max_sleep))
-            else:
-                self.max_sleep_seconds.set(5.0)
-            
-            search_mode = profile_settings.get("search_mode", "priority")
-            if search_mode in ["priority", "sequence"]:
-                self.search_mode.set(search_mode)
-            else:
-                self.search_mode.set("priority")
-            
+            self._apply_profile_options(self._get_profile_options(self.active_profile.get()))
         except Exception as e:
             print(f"Error loading profile settings: {e}")
-            self.confidence.set(0.8)
-            self.grayscale.set(True)
-            self.min_sleep_seconds.set(1.0)
-            self.max_sleep_seconds.set(5.0)
-            self.search_mode.set("priority")
+            self._apply_profile_options(ProfileOptions())
     
     def _save_current_profile_settings(self):
         try:
@@ -1539,16 +2093,14 @@ class NexusAutoDL:
             if not profile_name: 
                 return
             
-            if "profile_settings" not in self.config:
-                self.config["profile_settings"] = {}
-            
-            sequence = list(self.sequence_listbox.get(0, 'end')) if hasattr(self, 'sequence_listbox') else []
+            sequence = list(self._sequence_order)
             
-            self.config["profile_settings"][profile_name] = {
+            self._profile_settings[profile_name] = {
                 "confidence": self.confidence.get(),
                 "grayscale": self.grayscale.get(),
                 "min_sleep": self.min_sleep_seconds.get(),
                 "max_sleep": self.max_sleep_seconds.get(),
+                "cooldown": self.cooldown_seconds.get(),
                 "search_mode": self.search_mode.get(),
                 "sequence": sequence
             }
@@ -1558,15 +2110,18 @@ class NexusAutoDL:
     
     def _rename_profile_config(self, old_name: str, new_name: str):
         try:
-            if "profile_settings" in self.config and old_name in self.config["profile_settings"]:
-                self.config["profile_settings"][new_name] = self.config["profile_settings"].pop(old_name)
+            if old_name in self._profile_settings:
+                self._profile_settings[new_name] = self._profile_settings.pop(old_name)
+                self._profile_options_cache.pop(old_name, None)
+                self._config_dirty = True
         except Exception as e:
             print(f"Error renaming profile config: {e}")
     
     def _delete_profile_config(self, profile_name: str):
         try:
-            if "profile_settings" in self.config:
-                self.config["profile_settings"].pop(profile_name, None)
+            self._profile_options_cache.pop(profile_name, None)
+            if self._profile_settings.pop(profile_name, None) is not None:
+                self._config_dirty = True
         except Exception as e:
             print(f"Error deleting profile config: {e}")
 
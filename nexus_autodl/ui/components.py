@@ -4,12 +4,14 @@ Custom UI components for Nexus AutoDL.
 
 import weakref
 from tkinter import Toplevel, Label
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from ..constants import AppConstants
 from .theme_manager import ThemeManager
 
 class OptimizedHoverEffect:
-    _instances = weakref.WeakSet()
+    BIND_TAG = "HoverButton"
+    
+    _class_bound = False
     
     def __init__(self, widget, hover_key: str, theme_manager: ThemeManager, effect_type: str = "smooth"):
         self.widget = widget
@@ -17,11 +19,11 @@ class OptimizedHoverEffect:
         self.theme_manager = theme_manager
         self.effect_type = effect_type
         self.is_hovering = False
-        self._bound = False
+        self._hover_cfg: Dict[str, str] = {}
+        self._hover_epoch: Optional[int] = None
         
         self._store_original_properties()
         self._bind_events()
-        OptimizedHoverEffect._instances.add(self)
     
     def _store_original_properties(self):
         try:
@@ -32,21 +34,55 @@ class OptimizedHoverEffect:
             self.original_bg = self.theme_manager.get_color('button_bg_color')
             self.original_fg = self.theme_manager.get_color('button_fg_color')
             self.original_cursor = ""
+        
+        if self.effect_type == "subtle":
+            self._normal_cfg = {"cursor": self.original_cursor, "bg": self.original_bg}
+        else:
+            self._normal_cfg = {"cursor": self.original_cursor, "bg": self.original_bg, "fg": self.original_fg}
+    
+    def _hover_config(self) -> Dict[str, str]:
+        # Rebuilt only after the theme actually changes, so a hover is a single
+        # config() call with a ready-made dict.
+        epoch = self.theme_manager.epoch
+        if epoch != self._hover_epoch:
+            hover_bg = self.theme_manager.get_hover_color(self.hover_key)
+            if self.effect_type == "subtle":
+                self._hover_cfg = {"cursor": "hand2", "bg": hover_bg}
+            else:
+                self._hover_cfg = {"cursor": "hand2", "bg": hover_bg, "fg": "#FFFFFF"}
+            self._hover_epoch = epoch
+        return self._hover_cfg
     
     def _bind_events(self):
-        if not self._bound:
-            try:
-                self.widget.bind("<Enter>", self._on_enter, add='+')
-                self.widget.bind("<Leave>", self._on_leave, add='+')
-                self._bound = True
-            except Exception as e:
-                print(f"Failed to bind hover events: {e}")
+        # One pair of class bindings serves every hover button; the effect
+        # hangs off the widget, so it lives exactly as long as the widget does.
+        # Hover colours are read from the shared ThemeManager on each enter, so
+        # a theme switch needs no per-widget pass.
+        try:
+            cls = OptimizedHoverEffect
+            if not cls._class_bound:
+                self.widget.bind_class(cls.BIND_TAG, "<Enter>", cls._dispatch_enter)
+                self.widget.bind_class(cls.BIND_TAG, "<Leave>", cls._dispatch_leave)
+                cls._class_bound = True
+            
+            tags = self.widget.bindtags()
+            if cls.BIND_TAG not in tags:
+                self.widget.bindtags(tags + (cls.BIND_TAG,))
+            self.widget._hover_effect = self
+        except Exception as e:
+            print(f"Failed to bind hover events: {e}")
     
-    def update_theme(self, theme_manager: ThemeManager):
-        self.theme_manager = theme_manager
-        if not self.is_hovering:
-            self._store_original_properties()
-            self._apply_normal_state()
+    @staticmethod
+    def _dispatch_enter(event):
+        effect = getattr(event.widget, '_hover_effect', None)
+        if effect is not None:
+            effect._on_enter(event)
+    
+    @staticmethod
+    def _dispatch_leave(event):
+        effect = getattr(event.widget, '_hover_effect', None)
+        if effect is not None:
+            effect._on_leave(event)
     
     def _on_enter(self, event=None):
         if not self.is_hovering:
@@ -60,43 +96,28 @@ class OptimizedHoverEffect:
     
     def _apply_hover_state(self):
         try:
-            hover_bg = self.theme_manager.get_hover_color(self.hover_key)
-            hover_fg = "#FFFFFF"
-            
-            config_dict = {"cursor": "hand2"}
-            
-            if self.effect_type == "subtle":
-                config_dict["bg"] = hover_bg
-            else:
-                config_dict.update({"bg": hover_bg, "fg": hover_fg})
-            
-            self.widget.config(**config_dict)
+            self.widget.config(**self._hover_config())
         except Exception:
             pass
     
     def _apply_normal_state(self):
         try:
-            config_dict = {"cursor": self.original_cursor}
-            
-            if self.effect_type == "subtle":
-                config_dict["bg"] = self.original_bg
-            else:
-                config_dict.update({"bg": self.original_bg, "fg": self.original_fg})
-            
-            self.widget.config(**config_dict)
+            self.widget.config(**self._normal_cfg)
         except Exception:
             pass
-    
-    @classmethod
-    def update_all_themes(cls, theme_manager: ThemeManager):
-        for instance in cls._instances:
-            try:
-                instance.update_theme(theme_manager)
-            except Exception:
-                continue
 
 class EnhancedTooltip:
+    BIND_TAG = "EnhancedTooltip"
+    
     _instances = weakref.WeakSet()
+    _by_widget: "weakref.WeakValueDictionary[str, EnhancedTooltip]" = weakref.WeakValueDictionary()
+    _class_bound = False
+    _shared_window: Optional[Toplevel] = None
+    _shared_label: Optional[Label] = None
+    _active_owner: Optional["EnhancedTooltip"] = None
+    _label_state: Optional[Tuple[str, str, str]] = None
+    _window_topmost: Optional[bool] = None
+    _theme_epoch: Optional[int] = None
     
     def __init__(self, widget, text: str, theme_manager: ThemeManager, delay: int = AppConstants.TOOLTIP_DELAY):
         self.widget = widget
@@ -105,20 +126,39 @@ class EnhancedTooltip:
         self.delay = delay
         self.tooltip_window: Optional[Toplevel] = None
         self.schedule_id: Optional[str] = None
-        self._bound = False
         
         self._bind_events()
         EnhancedTooltip._instances.add(self)
     
     def _bind_events(self):
-        if not self._bound:
-            try:
-                self.widget.bind("<Enter>", self._on_enter, add='+')
-                self.widget.bind("<Leave>", self._on_leave, add='+')
-                self.widget.bind("<ButtonPress>", self._on_leave, add='+')
-                self._bound = True
-            except Exception as e:
-                print(f"Failed to bind tooltip events: {e}")
+        # Every tooltip shares one set of class bindings that dispatch on the
+        # widget path, instead of installing three bindings per widget.
+        try:
+            cls = EnhancedTooltip
+            if not cls._class_bound:
+                self.widget.bind_class(cls.BIND_TAG, "<Enter>", cls._dispatch_enter)
+                self.widget.bind_class(cls.BIND_TAG, "<Leave>", cls._dispatch_leave)
+                self.widget.bind_class(cls.BIND_TAG, "<ButtonPress>", cls._dispatch_leave)
+                cls._class_bound = True
+            
+            tags = self.widget.bindtags()
+            if cls.BIND_TAG not in tags:
+                self.widget.bindtags(tags[:1] + (cls.BIND_TAG,) + tags[1:])
+            cls._by_widget[str(self.widget)] = self
+        except Exception as e:
+            print(f"Failed to bind tooltip events: {e}")
+    
+    @classmethod
+    def _dispatch_enter(cls, event):
+        instance = cls._by_widget.get(str(event.widget))
+        if instance is not None:
+            instance._on_enter(event)
+    
+    @classmethod
+    def _dispatch_leave(cls, event):
+        instance = cls._by_widget.get(str(event.widget))
+        if instance is not None:
+            instance._on_leave(event)
     
     def update_theme(self, theme_manager: ThemeManager):
         self.theme_manager = theme_manager
@@ -149,28 +189,19 @@ class EnhancedTooltip:
         self._cancel_scheduled()
         self._hide_tooltip()
     
-    def _show_tooltip(self):
-        if self.tooltip_window:
-            return
-        
-        try:
-            x, y = self.widget.winfo_pointerxy()
-            self.tooltip_window = Toplevel(self.widget)
-            self.tooltip_window.overrideredirect(True)
-            self.tooltip_window.geometry(f"+{x+20}+{y+10}")
-            
-            try:
-                if self.widget.winfo_toplevel().attributes("-topmost"):
-                    self.tooltip_window.attributes("-topmost", True)
-            except Exception:
-                pass
+    @classmethod
+    def _get_shared_window(cls, widget) -> Tuple[Toplevel, Label]:
+        window = cls._shared_window
+        if window is None or cls._shared_label is None or not window.winfo_exists():
+            # Parent the shared window to the root so it outlives the widgets
+            # (and secondary windows) that get rebuilt on theme changes.
+            window = Toplevel(widget.nametowidget('.'))
+            window.withdraw()
+            window.overrideredirect(True)
             
             label = Label(
-                self.tooltip_window,
-                text=self.text,
+                window,
                 justify='left',
-                background=self.theme_manager.get_color('tooltip_bg_color'),
-                foreground=self.theme_manager.get_color('tooltip_fg_color'),
                 relief='solid',
                 borderwidth=1,
                 wraplength=300,
@@ -179,13 +210,61 @@ class EnhancedTooltip:
                 font=("Segoe UI", 9)
             )
             label.pack(ipadx=1)
+            
+            cls._shared_window = window
+            cls._shared_label = label
+            cls._active_owner = None
+            cls._label_state = None
+            cls._window_topmost = None
+        return window, cls._shared_label
+    
+    def _show_tooltip(self):
+        if self.tooltip_window and EnhancedTooltip._active_owner is self:
+            return
+        
+        try:
+            x, y = self.widget.winfo_pointerxy()
+            window, label = self._get_shared_window(self.widget)
+            
+            previous_owner = EnhancedTooltip._active_owner
+            if previous_owner is not None and previous_owner is not self:
+                previous_owner.tooltip_window = None
+            
+            # Re-hovering the same widget, or one with the same text, leaves the
+            # label alone instead of re-laying it out.
+            cls = EnhancedTooltip
+            label_state = (
+                self.text,
+                self.theme_manager.get_color('tooltip_bg_color'),
+                self.theme_manager.get_color('tooltip_fg_color')
+            )
+            if label_state != cls._label_state:
+                label.config(text=label_state[0], background=label_state[1], foreground=label_state[2])
+                cls._label_state = label_state
+            window.geometry(f"+{x+20}+{y+10}")
+            
+            try:
+                is_topmost = bool(self.widget.winfo_toplevel().attributes("-topmost"))
+            except Exception:
+                is_topmost = False
+            if is_topmost != cls._window_topmost:
+                window.attributes("-topmost", is_topmost)
+                cls._window_topmost = is_topmost
+            
+            window.deiconify()
+            window.lift()
+            
+            self.tooltip_window = window
+            EnhancedTooltip._active_owner = self
         except Exception:
             self._hide_tooltip()
     
     def _hide_tooltip(self):
         if self.tooltip_window:
             try:
-                self.tooltip_window.destroy()
+                if EnhancedTooltip._active_owner is self:
+                    self.tooltip_window.withdraw()
+                    EnhancedTooltip._active_owner = None
             except Exception:
                 pass
             finally:
@@ -193,6 +272,9 @@ class EnhancedTooltip:
     
     @classmethod
     def update_all_themes(cls, theme_manager: ThemeManager):
+        if cls._theme_epoch == theme_manager.epoch:
+            return
+        cls._theme_epoch = theme_manager.epoch
         for instance in cls._instances:
             try:
                 instance.update_theme(theme_manager)
@@ -83,6 +83,8 @@ class ThemeManager:
     
     def __init__(self, is_dark_mode: bool = False):
         self.is_dark_mode = is_dark_mode
+        # Bumped on every actual switch so listeners can tell whether they are stale.
+        self.epoch = 0
         self._update_theme()
     
     def _update_theme(self):
@@ -94,11 +96,13 @@ class ThemeManager:
         if self.is_dark_mode != is_dark_mode:
             self.is_dark_mode = is_dark_mode
             self._update_theme()
+            self.epoch += 1
             return True
         return False
     
     def get_color(self, color_key: str) -> str:
-        return self.current_theme.get(color_key, '#000000')
+        # Both themes define every key, so a plain subscript is enough.
+        return self.current_theme[color_key]
     
     def get_hover_color(self, hover_key: str) -> str:
         if hover_key in self.hover_colors:
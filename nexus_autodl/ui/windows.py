@@ -2,23 +2,48 @@
 Secondary windows for Nexus AutoDL.
 """
 
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING
 from tkinter import Toplevel, Frame, Label, Button, Entry, LabelFrame, Listbox, Scrollbar, messagebox
-from PIL import Image, ImageTk
+from PIL import Image
 from PIL.Image import open as open_image
 
 from ..constants import AppConstants
+from ..utils.helpers import cached_dir_listing, human_name_sort_key, invalidate_dir_listing, is_module_importable, lazy_import, parse_geometry
 from .theme_manager import ThemeManager
 from .components import OptimizedHoverEffect
 
+if TYPE_CHECKING:
+    from ..core.template_cache import EnhancedTemplateCache
+
+# str.endswith() takes a tuple, so the suffix test stays in C.
+_SUPPORTED_SUFFIXES = tuple(AppConstants.SUPPORTED_IMAGE_EXTENSIONS)
+
+# Decodes preview images away from the Tk thread; PIL releases the GIL while
+# decoding and resizing. Worker threads are only started on first use.
+_preview_executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                       thread_name_prefix="preview")
+
 class EnhancedTemplatePreviewWindow(Toplevel):
-    def __init__(self, parent, template_path: Path, theme_manager: ThemeManager):
+    # path -> (file mtime, PhotoImage, original size), least recently shown first.
+    _photo_cache: "OrderedDict[str, Tuple[float, Any, Tuple[int, int]]]" = OrderedDict()
+    
+    def __init__(self, parent, template_path: Path, theme_manager: ThemeManager,
+                 template_cache: Optional["EnhancedTemplateCache"] = None):
         super().__init__(parent)
         self.parent = parent
         self.template_path = template_path  
         self.theme_manager = theme_manager
+        self.template_cache = template_cache
         self.photo = None
+        self._loading_label: Optional[Label] = None
+        self._load_poll_id: Optional[str] = None
+        self._center_id: Optional[str] = None
         
         self._configure_window()
         
@@ -42,6 +67,12 @@ class EnhancedTemplatePreviewWindow(Toplevel):
         self.protocol("WM_DELETE_WINDOW", self._on_close)
     
     def _on_close(self):
+        if self._load_poll_id is not None:
+            self.after_cancel(self._load_poll_id)
+            self._load_poll_id = None
+        if self._center_id is not None:
+            self.after_cancel(self._center_id)
+            self._center_id = None
         if self.photo:
             try:
                 del self.photo
@@ -50,65 +81,157 @@ class EnhancedTemplatePreviewWindow(Toplevel):
         self.destroy()
     
     def _setup_ui(self):
+        path_str = str(self.template_path)
         try:
-            img, original_size = self._load_and_resize_image()
-            self.photo = ImageTk.PhotoImage(img)
+            mtime = os.stat(path_str).st_mtime
+        except OSError:
+            mtime = None
+        
+        # Reopening an unchanged template reuses the Tk image uploaded last time.
+        cached = EnhancedTemplatePreviewWindow._photo_cache.get(path_str)
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            EnhancedTemplatePreviewWindow._photo_cache.move_to_end(path_str)
+            self._show_image(cached[1], cached[2])
+            return
+        
+        self._loading_label = Label(self, text="Loading...", 
+                                    bg=self.theme_manager.get_color('preview_bg_color'), 
+                                    fg=self.theme_manager.get_color('secondary_fg_color'), 
+                                    font=("Segoe UI", 10), padx=60, pady=40)
+        self._loading_label.pack()
+        
+        future = _preview_executor.submit(self._load_and_resize_image)
+        self._load_poll_id = self.after(AppConstants.PREVIEW_POLL_INTERVAL, 
+                                        self._poll_image_load, future, mtime)
+    
+    def _poll_image_load(self, future: Future, mtime: Optional[float]):
+        self._load_poll_id = None
+        # The window may have been torn down along with its parent.
+        if not self.winfo_exists():
+            return
+        if not future.done():
+            self._load_poll_id = self.after(AppConstants.PREVIEW_POLL_INTERVAL, 
+                                            self._poll_image_load, future, mtime)
+            return
+        
+        self._loading_label.destroy()
+        self._loading_label = None
+        
+        try:
+            from PIL import ImageTk
+            
+            img, original_size = future.result()
+            photo = ImageTk.PhotoImage(img)
+        except Exception as e:
+            self._create_error_ui(str(e))
+            self._center_window()
+            return
+        
+        if mtime is not None:
+            cache = EnhancedTemplatePreviewWindow._photo_cache
+            cache[str(self.template_path)] = (mtime, photo, original_size)
+            cache.move_to_end(str(self.template_path))
+            while len(cache) > AppConstants.PREVIEW_CACHE_SIZE:
+                cache.popitem(last=False)
+        
+        self._show_image(photo, original_size)
+    
+    def _show_image(self, photo, original_size: Tuple[int, int]):
+        try:
+            self.photo = photo
             
             main_frame = Frame(self, bg=self.theme_manager.get_color('preview_bg_color'), padx=20, pady=20)
             main_frame.pack(fill="both", expand=True)
             
-            self._create_info_section(main_frame, original_size, img.size)
+            self._create_info_section(main_frame, original_size, (photo.width(), photo.height()))
             self._create_image_section(main_frame)
             self._create_button_section(main_frame)
             
         except Exception as e:
             self._create_error_ui(str(e))
+        
+        self._center_window()
+    
+    def _load_source_image(self, max_size: int) -> Tuple[Image.Image, Tuple[int, int]]:
+        if self.template_cache is not None and is_module_importable("cv2"):
+            cached = self.template_cache.get_template_with_arrays(self.template_path, copy_image=False)
+            if cached is not None and cached[1] is not None:
+                bgr = cached[1]
+                return self._shrink_bgr(bgr, max_size), (bgr.shape[1], bgr.shape[0])
+        
+        if self.template_cache is not None:
+            cached = self.template_cache.get_template(self.template_path)
+            if cached is not None:
+                # get_template already hands out a private copy.
+                return cached, cached.size
+        
+        with open(self.template_path, 'rb') as f:
+            img = open_image(f)
+            original_size = img.size
+            # Lets JPEG sources decode straight at a reduced scale; a no-op
+            # for other formats.
+            img.draft('RGB', (max_size, max_size))
+            img.load()
+        return img, original_size
+    
+    @staticmethod
+    def _shrink_bgr(bgr, max_size: int) -> Image.Image:
+        # Downscale the shared matcher array before it becomes a PIL image, so
+        # the preview never copies the full-size template. INTER_AREA averages
+        # whole source pixels, which suits shrinking.
+        cv2 = lazy_import("cv2")
+        height, width = bgr.shape[:2]
+        scale = min(max_size / width, max_size / height)
+        if scale < 1:
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            bgr = cv2.resize(bgr, size, interpolation=cv2.INTER_AREA)
+        return Image.fromarray(cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB))
     
     def _load_and_resize_image(self) -> Tuple[Image.Image, Tuple[int, int]]:
-        with open_image(self.template_path) as img:
-            original_size = (img.width, img.height)
-            
-            max_size = 400
-            if img.width > max_size or img.height > max_size:
-                ratio = min(max_size / img.width, max_size / img.height)
-                new_size = (int(img.width * ratio), int(img.height * ratio))
-                img = img.resize(new_size, Image.Resampling.LANCZOS)
-            
-            return img.copy(), original_size
+        max_size = 400
+        img, original_size = self._load_source_image(max_size)
+        
+        # thumbnail() only ever shrinks and works in place, keeping the aspect ratio.
+        # Its default reducing_gap already box-reduces by whole factors before
+        # the bilinear pass, so large downscales stay cheap.
+        img.thumbnail((max_size, max_size), Image.Resampling.BILINEAR)
+        
+        return img, original_size
+    
+    def _make_label(self, parent, text: str, fg_key: str = 'fg_color', 
+                    font: Tuple = ("Segoe UI", 9)) -> Label:
+        theme = self.theme_manager.current_theme
+        return Label(parent, text=text, bg=theme['preview_bg_color'], fg=theme[fg_key], font=font)
     
     def _create_info_section(self, parent, original_size, current_size):
         info_frame = Frame(parent, bg=self.theme_manager.get_color('preview_bg_color'))
         info_frame.pack(fill="x", pady=(0, 15))
         
-        Label(info_frame, text=f"File: {self.template_path.name}", 
-              bg=self.theme_manager.get_color('preview_bg_color'), 
-              fg=self.theme_manager.get_color('fg_color'), 
-              font=("Segoe UI", 10, "bold")).pack(anchor="w")
+        self._make_label(info_frame, f"File: {self.template_path.name}", 
+                         font=("Segoe UI", 10, "bold")).pack(anchor="w")
         
-        Label(info_frame, text=f"Original Size: {original_size[0]}×{original_size[1]} pixels", 
-              bg=self.theme_manager.get_color('preview_bg_color'), 
-              fg=self.theme_manager.get_color('secondary_fg_color'), 
-              font=("Segoe UI", 9)).pack(anchor="w")
+        self._make_label(info_frame, f"Original Size: {original_size[0]}×{original_size[1]} pixels", 
+                         'secondary_fg_color').pack(anchor="w")
         
         if current_size != original_size:
-            Label(info_frame, text=f"Preview Size: {current_size[0]}×{current_size[1]} pixels (scaled)", 
-                  bg=self.theme_manager.get_color('preview_bg_color'), 
-                  fg=self.theme_manager.get_color('secondary_fg_color'), 
-                  font=("Segoe UI", 9)).pack(anchor="w")
+            self._make_label(info_frame, f"Preview Size: {current_size[0]}×{current_size[1]} pixels (scaled)", 
+                             'secondary_fg_color').pack(anchor="w")
     
     def _create_image_section(self, parent):
-        image_frame = Frame(parent, bg=self.theme_manager.get_color('input_bg_color'), 
+        theme = self.theme_manager.current_theme
+        image_frame = Frame(parent, bg=theme['input_bg_color'], 
                            relief="solid", bd=1)
         image_frame.pack(pady=15)
         
         image_label = Label(image_frame, image=self.photo, 
-                           bg=self.theme_manager.get_color('input_bg_color'))
+                           bg=theme['input_bg_color'])
         image_label.pack(padx=8, pady=8)
     
     def _create_button_section(self, parent):
+        theme = self.theme_manager.current_theme
         close_btn = Button(parent, text="Close", command=self._on_close,
-                          bg=self.theme_manager.get_color('button_bg_color'), 
-                          fg=self.theme_manager.get_color('button_fg_color'), 
+                          bg=theme['button_bg_color'], 
+                          fg=theme['button_fg_color'], 
                           bd=0, padx=30, pady=8, 
                           font=("Segoe UI", 9), cursor="hand2", relief="flat")
         close_btn.pack(pady=(20, 0))
@@ -116,28 +239,22 @@ class EnhancedTemplatePreviewWindow(Toplevel):
         OptimizedHoverEffect(close_btn, 'close', self.theme_manager)
     
     def _create_error_ui(self, error_message: str):
-        error_frame = Frame(self, bg=self.theme_manager.get_color('preview_bg_color'), 
+        theme = self.theme_manager.current_theme
+        error_frame = Frame(self, bg=theme['preview_bg_color'], 
                            padx=40, pady=40)
         error_frame.pack(fill="both", expand=True)
         
-        Label(error_frame, text="⚠", 
-              bg=self.theme_manager.get_color('preview_bg_color'), 
-              fg=self.theme_manager.get_color('error_fg_color'), 
-              font=("Segoe UI", 24)).pack(pady=(0, 10))
+        self._make_label(error_frame, "⚠", 'error_fg_color', 
+                         font=("Segoe UI", 24)).pack(pady=(0, 10))
         
-        Label(error_frame, text="Unable to load image preview", 
-              bg=self.theme_manager.get_color('preview_bg_color'), 
-              fg=self.theme_manager.get_color('error_fg_color'), 
-              font=("Segoe UI", 11, "bold")).pack(pady=(0, 5))
+        self._make_label(error_frame, "Unable to load image preview", 'error_fg_color', 
+                         font=("Segoe UI", 11, "bold")).pack(pady=(0, 5))
         
-        Label(error_frame, text=f"Error: {error_message}", 
-              bg=self.theme_manager.get_color('preview_bg_color'), 
-              fg=self.theme_manager.get_color('fg_color'), 
-              font=("Segoe UI", 9)).pack(pady=(0, 20))
+        self._make_label(error_frame, f"Error: {error_message}").pack(pady=(0, 20))
         
         close_btn = Button(error_frame, text="Close", command=self._on_close,
-                          bg=self.theme_manager.get_color('button_bg_color'), 
-                          fg=self.theme_manager.get_color('button_fg_color'), 
+                          bg=theme['button_bg_color'], 
+                          fg=theme['button_fg_color'], 
                           bd=0, padx=30, pady=8, 
                           font=("Segoe UI", 9), cursor="hand2", relief="flat")
         close_btn.pack()
@@ -145,15 +262,19 @@ class EnhancedTemplatePreviewWindow(Toplevel):
         OptimizedHoverEffect(close_btn, 'close', self.theme_manager)
     
     def _center_window(self):
-        self.update_idletasks()
-        
-        parent_x = self.parent.winfo_x()
-        parent_y = self.parent.winfo_y()
-        parent_width = self.parent.winfo_width()
-        parent_height = self.parent.winfo_height()
+        # Centre once Tk has laid the window out on its own, rather than forcing
+        # a synchronous update_idletasks() pass to learn the size.
+        if self._center_id is not None:
+            self.after_cancel(self._center_id)
+        self._center_id = self.after_idle(self._finish_center)
+    
+    def _finish_center(self):
+        self._center_id = None
+        if not self.winfo_exists():
+            return
         
-        my_width = self.winfo_width()
-        my_height = self.winfo_height()
+        parent_width, parent_height, parent_x, parent_y = parse_geometry(self.parent.winfo_geometry())
+        my_width, my_height = self.winfo_reqwidth(), self.winfo_reqheight()
         
         pos_x = parent_x + (parent_width - my_width) // 2
         pos_y = parent_y + (parent_height - my_height) // 2
@@ -164,10 +285,20 @@ class EnhancedTemplatePreviewWindow(Toplevel):
         self.geometry(f"+{pos_x}+{pos_y}")
 
 class EnhancedProfileManagerWindow(Toplevel):
+    # Theme-independent part of the profile and template buttons' options.
+    _BUTTON_STYLE = {
+        "bd": 0, "padx": 12, "pady": 5, 
+        "font": ("Segoe UI", 9), "cursor": "hand2", "relief": "flat"
+    }
+    _ACTIVE_SUFFIX = " (Active)"
+    
     def __init__(self, parent_app):
         super().__init__(parent_app.root)
         self.parent_app = parent_app
         self.theme_manager = parent_app.theme_manager
+        self._profile_names: List[str] = []
+        self._template_fill_id: Optional[str] = None
+        self._action_buttons: List[Button] = []
         
         self._configure_window()
         self._setup_ui()
@@ -183,13 +314,13 @@ class EnhancedProfileManagerWindow(Toplevel):
         self.minsize(600, 450)
     
     def _center_window(self):
-        self.update_idletasks()
+        # The size comes from PROFILE_MANAGER_SIZE, so there is no need to force a
+        # layout pass with update_idletasks() before the single geometry() call.
         parent = self.parent_app.root
         
         width, height = map(int, AppConstants.PROFILE_MANAGER_SIZE.split('x'))
         
-        parent_x, parent_y = parent.winfo_x(), parent.winfo_y()
-        parent_width, parent_height = parent.winfo_width(), parent.winfo_height()
+        parent_width, parent_height, parent_x, parent_y = parse_geometry(parent.winfo_geometry())
         
         pos_x = parent_x + (parent_width - width) // 2
         pos_y = parent_y + (parent_height - height) // 2
@@ -208,34 +339,36 @@ class EnhancedProfileManagerWindow(Toplevel):
         self._create_content_section(main_frame)
     
     def _create_header(self, parent):
-        header_frame = Frame(parent, bg=self.theme_manager.get_color('bg_color'))
+        theme = self.theme_manager.current_theme
+        header_frame = Frame(parent, bg=theme['bg_color'])
         header_frame.pack(fill="x", pady=(0, 15))
         
         title_label = Label(header_frame, text="Profile & Template Manager", 
-                           bg=self.theme_manager.get_color('bg_color'), 
-                           fg=self.theme_manager.get_color('fg_color'), 
+                           bg=theme['bg_color'], 
+                           fg=theme['fg_color'], 
                            font=("Segoe UI", 13, "bold"))
         title_label.pack(side="left")
     
     def _create_directory_section(self, parent):
-        dir_frame = Frame(parent, bg=self.theme_manager.get_color('bg_color'))
+        theme = self.theme_manager.current_theme
+        dir_frame = Frame(parent, bg=theme['bg_color'])
         dir_frame.pack(fill="x", pady=(0, 15))
         
         Label(dir_frame, text="Profiles Directory:", 
-              bg=self.theme_manager.get_color('bg_color'), 
-              fg=self.theme_manager.get_color('fg_color'), 
+              bg=theme['bg_color'], 
+              fg=theme['fg_color'], 
               font=("Segoe UI", 10)).pack(side="left")
         
         path_entry = Entry(dir_frame, textvariable=self.parent_app.profiles_root_path, 
                           state="readonly", 
-                          readonlybackground=self.theme_manager.get_color('readonly_bg_color'), 
-                          fg=self.theme_manager.get_color('input_fg_color'), 
+                          readonlybackground=theme['readonly_bg_color'], 
+                          fg=theme['input_fg_color'], 
                           bd=1, font=("Segoe UI", 9))
         path_entry.pack(side="left", fill="x", expand=True, padx=(10, 10))
         
         browse_btn = Button(dir_frame, text="Browse...", command=self._select_profiles_root, 
-                           bg=self.theme_manager.get_color('button_bg_color'), 
-                           fg=self.theme_manager.get_color('button_fg_color'), 
+                           bg=theme['button_bg_color'], 
+                           fg=theme['button_fg_color'], 
                            bd=0, padx=15, pady=6, font=("Segoe UI", 9), 
                            cursor="hand2", relief="flat")
         browse_btn.pack(side="right")
@@ -250,46 +383,43 @@ class EnhancedProfileManagerWindow(Toplevel):
         self._create_templates_panel(content_frame)
     
     def _create_profiles_panel(self, parent):
+        theme = self.theme_manager.current_theme
         left_panel = LabelFrame(parent, text="Profiles", 
-                               bg=self.theme_manager.get_color('bg_color'), 
-                               fg=self.theme_manager.get_color('fg_color'), 
+                               bg=theme['bg_color'], 
+                               fg=theme['fg_color'], 
                                padx=10, pady=10, 
                                font=("Segoe UI", 10, "bold"))
         left_panel.pack(side="left", fill="both", expand=True, padx=(0, 8))
         
-        profile_list_frame = Frame(left_panel, bg=self.theme_manager.get_color('bg_color'))
+        profile_list_frame = Frame(left_panel, bg=theme['bg_color'])
         profile_list_frame.pack(fill="both", expand=True)
         
         self.profile_listbox = Listbox(profile_list_frame, 
-                                      bg=self.theme_manager.get_color('input_bg_color'), 
-                                      fg=self.theme_manager.get_color('input_fg_color'), 
+                                      bg=theme['input_bg_color'], 
+                                      fg=theme['input_fg_color'], 
                                       bd=0, highlightthickness=0, 
-                                      selectbackground=self.theme_manager.get_color('selection_bg_color'), 
-                                      selectforeground=self.theme_manager.get_color('selection_fg_color'),
+                                      selectbackground=theme['selection_bg_color'], 
+                                      selectforeground=theme['selection_fg_color'],
                                       exportselection=False, font=("Segoe UI", 9))
         self.profile_listbox.pack(side="left", fill="both", expand=True)
         self.profile_listbox.bind("<<ListboxSelect>>", self._on_profile_select)
         self.profile_listbox.bind("<Double-Button-1>", self._set_active_profile)
         
         profile_scrollbar = Scrollbar(profile_list_frame, command=self.profile_listbox.yview,
-                                     bg=self.theme_manager.get_color('bg_color'),
-                                     troughcolor=self.theme_manager.get_color('input_bg_color'),
-                                     activebackground=self.theme_manager.get_color('selection_bg_color'))
+                                     bg=theme['bg_color'],
+                                     troughcolor=theme['input_bg_color'],
+                                     activebackground=theme['selection_bg_color'])
         profile_scrollbar.pack(side="right", fill="y")
         self.profile_listbox.config(yscrollcommand=profile_scrollbar.set)
 
         self._create_profile_buttons(left_panel)
     
     def _create_profile_buttons(self, parent):
-        profile_buttons_frame = Frame(parent, bg=self.theme_manager.get_color('bg_color'))
+        theme = self.theme_manager.current_theme
+        profile_buttons_frame = Frame(parent, bg=theme['bg_color'])
         profile_buttons_frame.pack(fill="x", pady=(10, 0))
         
-        button_style = {
-            "bg": self.theme_manager.get_color('button_bg_color'), 
-            "fg": self.theme_manager.get_color('button_fg_color'), 
-            "bd": 0, "padx": 12, "pady": 5, 
-            "font": ("Segoe UI", 9), "cursor": "hand2", "relief": "flat"
-        }
+        button_style = {**self._BUTTON_STYLE, "bg": theme['button_bg_color'], "fg": theme['button_fg_color']}
         
         new_btn = Button(profile_buttons_frame, text="New", command=self._create_profile, **button_style)
         new_btn.pack(side="left")
@@ -307,47 +437,46 @@ class EnhancedProfileManagerWindow(Toplevel):
                                command=self._set_active_profile, **button_style)
         set_active_btn.pack(side="right")
         OptimizedHoverEffect(set_active_btn, 'set_active', self.theme_manager)
+        
+        self._action_buttons.extend((new_btn, rename_btn, delete_btn, set_active_btn))
     
     def _create_templates_panel(self, parent):
+        theme = self.theme_manager.current_theme
         right_panel = LabelFrame(parent, text="Templates", 
-                                bg=self.theme_manager.get_color('bg_color'), 
-                                fg=self.theme_manager.get_color('fg_color'), 
+                                bg=theme['bg_color'], 
+                                fg=theme['fg_color'], 
                                 padx=10, pady=10, 
                                 font=("Segoe UI", 10, "bold"))
         right_panel.pack(side="right", fill="both", expand=True, padx=(8, 0))
         
-        template_list_frame = Frame(right_panel, bg=self.theme_manager.get_color('bg_color'))
+        template_list_frame = Frame(right_panel, bg=theme['bg_color'])
         template_list_frame.pack(fill="both", expand=True)
         
         self.template_listbox = Listbox(template_list_frame, 
-                                       bg=self.theme_manager.get_color('input_bg_color'), 
-                                       fg=self.theme_manager.get_color('input_fg_color'), 
+                                       bg=theme['input_bg_color'], 
+                                       fg=theme['input_fg_color'], 
                                        bd=0, highlightthickness=0, 
-                                       selectbackground=self.theme_manager.get_color('selection_bg_color'), 
-                                       selectforeground=self.theme_manager.get_color('selection_fg_color'),
+                                       selectbackground=theme['selection_bg_color'], 
+                                       selectforeground=theme['selection_fg_color'],
                                        exportselection=False, font=("Segoe UI", 9))
         self.template_listbox.pack(side="left", fill="both", expand=True)
         self.template_listbox.bind("<Double-Button-1>", self._preview_template)
         
         template_scrollbar = Scrollbar(template_list_frame, command=self.template_listbox.yview,
-                                      bg=self.theme_manager.get_color('bg_color'),
-                                      troughcolor=self.theme_manager.get_color('input_bg_color'),
-                                      activebackground=self.theme_manager.get_color('selection_bg_color'))
+                                      bg=theme['bg_color'],
+                                      troughcolor=theme['input_bg_color'],
+                                      activebackground=theme['selection_bg_color'])
         template_scrollbar.pack(side="right", fill="y")
         self.template_listbox.config(yscrollcommand=template_scrollbar.set)
         
         self._create_template_buttons(right_panel)
         
     def _create_template_buttons(self, parent):
-        template_buttons_frame = Frame(parent, bg=self.theme_manager.get_color('bg_color'))
+        theme = self.theme_manager.current_theme
+        template_buttons_frame = Frame(parent, bg=theme['bg_color'])
         template_buttons_frame.pack(fill="x", pady=(10, 0))
         
-        button_style = {
-            "bg": self.theme_manager.get_color('button_bg_color'), 
-            "fg": self.theme_manager.get_color('button_fg_color'), 
-            "bd": 0, "padx": 12, "pady": 5, 
-            "font": ("Segoe UI", 9), "cursor": "hand2", "relief": "flat"
-        }
+        button_style = {**self._BUTTON_STYLE, "bg": theme['button_bg_color'], "fg": theme['button_fg_color']}
         
         preview_btn = Button(template_buttons_frame, text="Preview", command=self._preview_template, **button_style)
         preview_btn.pack(side="left")
@@ -356,47 +485,74 @@ class EnhancedProfileManagerWindow(Toplevel):
         delete_tmpl_btn = Button(template_buttons_frame, text="Delete", command=self._delete_template, **button_style)
         delete_tmpl_btn.pack(side="right")
         OptimizedHoverEffect(delete_tmpl_btn, 'delete', self.theme_manager)
+        
+        self._action_buttons.extend((preview_btn, delete_tmpl_btn))
     
     def _populate_profile_list(self):
         self.profile_listbox.delete(0, 'end')
-        profiles = self.parent_app.get_profiles()
+        profiles = self.parent_app.get_profiles() or []
+        self._profile_names = profiles
         
         active_profile = self.parent_app.active_profile.get()
         
-        for i, profile in enumerate(profiles):
-            display_name = profile
-            if profile == active_profile:
-                display_name += " (Active)"
-            self.profile_listbox.insert('end', display_name)
-            
-            if profile == active_profile:
-                self.profile_listbox.itemconfig(i, {'fg': self.theme_manager.get_color('success_fg_color')})
+        # Only the active row gets a new string; the rest reuse the names as-is.
+        items = [p + self._ACTIVE_SUFFIX if p == active_profile else p for p in profiles]
+        if items:
+            self.profile_listbox.insert('end', *items)
+        
+        if active_profile in profiles:
+            self.profile_listbox.itemconfig(
+                profiles.index(active_profile), {'fg': self.theme_manager.get_color('success_fg_color')}
+            )
     
-    def _on_profile_select(self, event):
+    def _get_selected_profile(self) -> Optional[str]:
         selection = self.profile_listbox.curselection()
-        if not selection:
+        if not selection or selection[0] >= len(self._profile_names):
+            return None
+        return self._profile_names[selection[0]]
+    
+    def _on_profile_select(self, event):
+        profile_name = self._get_selected_profile()
+        if not profile_name:
             return
-            
-        profile_display = self.profile_listbox.get(selection[0])
-        profile_name = profile_display.replace(" (Active)", "")
         
-        self._populate_template_list(profile_name)
+        # Let Tk paint the new selection before scanning the folder, and fold
+        # quick arrow-key runs into a single scan of the last profile reached.
+        root = self.parent_app.root
+        if self._template_fill_id is not None:
+            root.after_cancel(self._template_fill_id)
+        self._template_fill_id = root.after_idle(self._fill_template_list, profile_name)
+    
+    def _fill_template_list(self, profile_name: str):
+        self._template_fill_id = None
+        if self.winfo_exists():
+            self._populate_template_list(profile_name)
     
     def _populate_template_list(self, profile_name):
         self.template_listbox.delete(0, 'end')
         
-        profiles_path = Path(self.parent_app.profiles_root_path.get())
+        profiles_path = self.parent_app.profiles_root
         profile_path = profiles_path / profile_name
         
-        if not profile_path.exists():
+        # A missing folder is caught here instead of stat-ing it first.
+        try:
+            templates = cached_dir_listing(profile_path, self._scan_templates)
+        except (FileNotFoundError, NotADirectoryError):
             return
             
-        templates = []
-        for ext in AppConstants.SUPPORTED_IMAGE_EXTENSIONS:
-            templates.extend(profile_path.glob(f"*{ext}"))
-            
-        for template in sorted(templates, key=lambda p: p.name.lower()):
-            self.template_listbox.insert('end', template.name)
+        if templates:
+            self.template_listbox.insert('end', *templates)
+    
+    @staticmethod
+    def _scan_templates(profile_path: str) -> List[str]:
+        # Sorting the DirEntry names directly avoids building a Path per file.
+        allowed = _SUPPORTED_SUFFIXES
+        with os.scandir(profile_path) as it:
+            return sorted(
+                (e.name for e in it
+                 if e.is_file(follow_symlinks=False) and e.name.lower().endswith(allowed)),
+                key=human_name_sort_key
+            )
     
     def _select_profiles_root(self):
         from tkinter import filedialog
@@ -413,13 +569,10 @@ class EnhancedProfileManagerWindow(Toplevel):
         self._populate_profile_list()
     
     def _rename_profile(self):
-        selection = self.profile_listbox.curselection()
-        if not selection:
+        old_name = self._get_selected_profile()
+        if not old_name:
             messagebox.showwarning("Selection Required", "Please select a profile to rename.", parent=self)
             return
-            
-        profile_display = self.profile_listbox.get(selection[0])
-        old_name = profile_display.replace(" (Active)", "")
         
         from tkinter import simpledialog
         new_name = simpledialog.askstring("Rename Profile", f"Enter new name for '{old_name}':", parent=self)
@@ -437,15 +590,17 @@ class EnhancedProfileManagerWindow(Toplevel):
                 messagebox.showerror("Invalid Name", "Profile name contains invalid characters.", parent=self)
                 return
                 
-            root = Path(self.parent_app.profiles_root_path.get())
+            root = self.parent_app.profiles_root
             old_path = root / old_name
             new_path = root / new_name
             
-            if new_path.exists():
+            if os.path.exists(new_path):
                 messagebox.showwarning("Profile Exists", f"A profile named '{new_name}' already exists.", parent=self)
                 return
                 
             old_path.rename(new_path)
+            invalidate_dir_listing(root)
+            invalidate_dir_listing(old_path)
             
             self.parent_app._rename_profile_config(old_name, new_name)
             
@@ -460,41 +615,92 @@ class EnhancedProfileManagerWindow(Toplevel):
             messagebox.showerror("Error", f"Failed to rename profile: {e}", parent=self)
     
     def _delete_profile(self):
-        selection = self.profile_listbox.curselection()
-        if not selection:
+        profile_name = self._get_selected_profile()
+        if not profile_name:
             messagebox.showwarning("Selection Required", "Please select a profile to delete.", parent=self)
             return
-            
-        profile_display = self.profile_listbox.get(selection[0])
-        profile_name = profile_display.replace(" (Active)", "")
         
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete profile '{profile_name}'?\nThis cannot be undone.", parent=self):
             try:
-                import shutil
-                root = Path(self.parent_app.profiles_root_path.get())
-                shutil.rmtree(root / profile_name)
+                root = self.parent_app.profiles_root
+                profile_path = root / profile_name
                 
-                self.parent_app._delete_profile_config(profile_name)
+                with os.scandir(profile_path) as it:
+                    for entry in it:
+                        self.parent_app.template_cache.invalidate_template(Path(entry.path))
                 
-                if self.parent_app.active_profile.get() == profile_name:
-                    self.parent_app.active_profile.set("")
-                    
-                self.parent_app._save_config()
-                self.parent_app._update_profile_list()
-                self._populate_profile_list()
-                self.template_listbox.delete(0, 'end')
+                errors: List[Exception] = []
+                worker = threading.Thread(
+                    target=self._remove_profile_dir, args=(profile_path, errors), daemon=True
+                )
+                self._set_busy(True)
+                self.parent_app._profiles_being_deleted.add(profile_name)
+                worker.start()
+                self.parent_app.root.after(100, self._finish_profile_delete, worker, profile_name, errors)
                 
             except Exception as e:
+                self.parent_app._profiles_being_deleted.discard(profile_name)
+                self._set_busy(False)
                 messagebox.showerror("Error", f"Failed to delete profile: {e}", parent=self)
     
+    @staticmethod
+    def _remove_profile_dir(profile_path: Path, errors: List[Exception]):
+        try:
+            shutil.rmtree(profile_path)
+        except Exception as e:
+            errors.append(e)
+    
+    def _finish_profile_delete(self, worker: threading.Thread, profile_name: str, errors: List[Exception]):
+        if worker.is_alive():
+            self.parent_app.root.after(100, self._finish_profile_delete, worker, profile_name, errors)
+            return
+        
+        self.parent_app._profiles_being_deleted.discard(profile_name)
+        window_open = self.winfo_exists()
+        if window_open:
+            self._set_busy(False)
+        
+        try:
+            if errors:
+                raise errors[0]
+            
+            invalidate_dir_listing(self.parent_app.profiles_root)
+            invalidate_dir_listing(self.parent_app.profiles_root / profile_name)
+            self.parent_app._delete_profile_config(profile_name)
+            
+            if self.parent_app.active_profile.get() == profile_name:
+                self.parent_app.active_profile.set("")
+                
+            self.parent_app._save_config()
+            self.parent_app._update_profile_list()
+            
+            if window_open:
+                self._populate_profile_list()
+                self.template_listbox.delete(0, 'end')
+                
+        except Exception as e:
+            if window_open:
+                self._populate_profile_list()
+            messagebox.showerror("Error", f"Failed to delete profile: {e}",
+                                 parent=self if window_open else self.parent_app.root)
+    
+    def _set_busy(self, busy: bool):
+        try:
+            state = "disabled" if busy else "normal"
+            self.config(cursor="watch" if busy else "")
+            # Nothing may act on a profile folder while it is being removed.
+            self.profile_listbox.config(state=state)
+            self.template_listbox.config(state=state)
+            for button in self._action_buttons:
+                button.config(state=state)
+        except Exception:
+            pass
+    
     def _set_active_profile(self, event=None):
-        selection = self.profile_listbox.curselection()
-        if not selection:
+        profile_name = self._get_selected_profile()
+        if not profile_name:
             messagebox.showwarning("Selection Required", "Please select a profile to set as active.", parent=self)
             return
-            
-        profile_display = self.profile_listbox.get(selection[0])
-        profile_name = profile_display.replace(" (Active)", "")
         
         self.parent_app.active_profile.set(profile_name)
         self.parent_app._save_config()
@@ -503,12 +709,9 @@ class EnhancedProfileManagerWindow(Toplevel):
         messagebox.showinfo("Profile Activated", f"Profile '{profile_name}' is now active.", parent=self)
     
     def _preview_template(self, event=None):
-        selection = self.profile_listbox.curselection()
-        if not selection:
+        profile_name = self._get_selected_profile()
+        if not profile_name:
             return
-            
-        profile_display = self.profile_listbox.get(selection[0])
-        profile_name = profile_display.replace(" (Active)", "")
         
         tmpl_selection = self.template_listbox.curselection()
         if not tmpl_selection:
@@ -516,18 +719,20 @@ class EnhancedProfileManagerWindow(Toplevel):
             
         template_name = self.template_listbox.get(tmpl_selection[0])
         
-        profiles_path = Path(self.parent_app.profiles_root_path.get())
+        profiles_path = self.parent_app.profiles_root
         template_path = profiles_path / profile_name / template_name
         
-        EnhancedTemplatePreviewWindow(self, template_path, self.theme_manager)
+        # Only the active profile's templates go through the shared cache; browsing
+        # other profiles must not evict what the match run uses or dirty its .npz.
+        template_cache = None
+        if profile_name == self.parent_app.active_profile.get():
+            template_cache = self.parent_app.template_cache
+        EnhancedTemplatePreviewWindow(self, template_path, self.theme_manager, template_cache)
     
     def _delete_template(self):
-        selection = self.profile_listbox.curselection()
-        if not selection:
+        profile_name = self._get_selected_profile()
+        if not profile_name:
             return
-            
-        profile_display = self.profile_listbox.get(selection[0])
-        profile_name = profile_display.replace(" (Active)", "")
         
         tmpl_selection = self.template_listbox.curselection()
         if not tmpl_selection:
@@ -538,11 +743,11 @@ class EnhancedProfileManagerWindow(Toplevel):
         
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete template '{template_name}'?", parent=self):
             try:
-                profiles_path = Path(self.parent_app.profiles_root_path.get())
+                profiles_path = self.parent_app.profiles_root
                 template_path = profiles_path / profile_name / template_name
                 
-                import os
                 os.remove(template_path)
+                invalidate_dir_listing(template_path.parent)
                 
                 self.parent_app.template_cache.invalidate_template(template_path)
                 self._populate_template_list(profile_name)
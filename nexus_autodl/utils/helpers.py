@@ -2,39 +2,152 @@
 Helper functions for Nexus AutoDL.
 """
 
+import importlib
+import importlib.util
+import json
+import os
 import re
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from ..constants import AppConstants
 
-INTEGER_PATTERN = re.compile(r"([0-9]+)")
+INTEGER_PATTERN = re.compile(r"([0-9]+)", re.ASCII)
+GEOMETRY_PATTERN = re.compile(r"(\d+)x(\d+)([+-]-?\d+)([+-]-?\d+)")
+
+@lru_cache(maxsize=4096)
+def human_name_sort_key(name: str) -> Tuple[Union[int, str], ...]:
+    """
+    Same ordering as human_sort_key, for plain file names (e.g. DirEntry.name).
+    """
+    # split() with a capturing group puts the digit runs at the odd indices,
+    # so there is no need to re-test every part with isdigit().
+    parts: List[Union[int, str]] = list(INTEGER_PATTERN.split(name.lower()))
+    parts[1::2] = [int(p) for p in parts[1::2]]
+    return tuple(parts)
 
 def human_sort_key(path: Path) -> Tuple[Union[int, str], ...]:
     """
     Sorts paths in a human-readable way (e.g., 1, 2, 10 instead of 1, 10, 2).
     """
-    return tuple(
-        int(c) if c.isdigit() else c.lower() 
-        for c in INTEGER_PATTERN.split(path.name)
-    )
+    return human_name_sort_key(path.name)
+
+def clear_human_sort_cache():
+    """
+    Drops the memoized sort keys, e.g. once the names they were built for
+    belong to a profiles folder that is no longer in use.
+    """
+    human_name_sort_key.cache_clear()
+
+_dir_listings: Dict[str, Tuple[int, List[str]]] = {}
+
+def cached_dir_listing(path: Union[str, Path], scan: Callable[[str], List[str]]) -> List[str]:
+    """
+    Returns scan(path), reusing the previous result while the directory's
+    mtime is unchanged. Adding, removing or renaming an entry bumps that
+    mtime, so changes made outside the app are picked up too.
+    Raises OSError (e.g. FileNotFoundError) when the directory is missing.
+    """
+    path_str = os.fspath(path)
+    mtime_ns = os.stat(path_str).st_mtime_ns
+    cached = _dir_listings.get(path_str)
+    if cached is not None and cached[0] == mtime_ns:
+        return list(cached[1])
+    
+    names = scan(path_str)
+    _dir_listings[path_str] = (mtime_ns, names)
+    return list(names)
+
+def invalidate_dir_listing(path: Optional[Union[str, Path]] = None):
+    """
+    Forgets the cached listing of path (or of every directory), for changes
+    the app makes itself that a coarse filesystem mtime might not reflect.
+    """
+    if path is None:
+        _dir_listings.clear()
+    else:
+        _dir_listings.pop(os.fspath(path), None)
+
+def is_module_available(name: str) -> bool:
+    """
+    Checks whether a module can be imported, without actually importing it.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+@lru_cache(maxsize=None)
+def lazy_import(name: str):
+    """
+    Imports a heavy module on first use and returns the cached module afterwards.
+    """
+    return importlib.import_module(name)
+
+@lru_cache(maxsize=None)
+def is_module_importable(name: str) -> bool:
+    """
+    Imports an optional module the first time a backend that needs it is
+    selected, and reports whether that worked. A module that is installed but
+    fails to load, e.g. over a missing DLL or an ABI mismatch, passes
+    is_module_available() yet is treated here as if it were missing.
+    """
+    if not is_module_available(name):
+        return False
+    try:
+        lazy_import(name)
+        return True
+    except Exception as e:
+        print(f"Failed to import {name}, continuing without it: {e}")
+        return False
+
+HAS_ORJSON = is_module_available("orjson")
+
+def dump_json(data: Any) -> bytes:
+    """
+    Serializes data to indented UTF-8 JSON, using orjson when it is installed.
+    """
+    if HAS_ORJSON:
+        orjson = lazy_import("orjson")
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+def load_json(raw: bytes) -> Any:
+    """
+    Parses UTF-8 JSON, using orjson when it is installed. orjson's decode
+    error subclasses json.JSONDecodeError, so callers catch either the same way.
+    """
+    if HAS_ORJSON:
+        return lazy_import("orjson").loads(raw)
+    return json.loads(raw)
 
 def safe_path_operation(func):
     """
-    Decorator to safely handle path operations.
+    Decorator to safely handle path operations. Only filesystem errors are
+    swallowed (IOError and PermissionError are both OSError); anything else
+    propagates to the caller.
     """
+    @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except (OSError, IOError, PermissionError) as e:
+        except OSError as e:
             print(f"Path operation failed: {e}")
             return None
-        except Exception as e:
-            print(f"Unexpected error in path operation: {e}")
-            return None
     return wrapper
 
+def parse_geometry(geometry: str) -> Tuple[int, int, int, int]:
+    """
+    Parses a Tk "WxH+X+Y" geometry string into (width, height, x, y).
+    """
+    match = GEOMETRY_PATTERN.match(geometry)
+    if not match:
+        raise ValueError(f"Invalid geometry: {geometry!r}")
+    width, height, x, y = match.groups()
+    return int(width), int(height), int(x.replace("+", "")), int(y.replace("+", ""))
+
 def validate_filename(filename: str) -> bool:
     """
     Validates that a filename does not contain invalid characters.
     """
-    return not any(char in filename for char in AppConstants.INVALID_FILENAME_CHARS)
+    return AppConstants.INVALID_FILENAME_CHARS.isdisjoint(filename)
@@ -0,0 +1,39 @@
+"""
+Checks the optional-module detection in nexus_autodl.utils.helpers.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from nexus_autodl.utils.helpers import is_module_available, is_module_importable
+
+class ModuleDetectionTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        sys.path.insert(0, self._directory.name)
+        self.addCleanup(sys.path.remove, self._directory.name)
+    
+    def _write_module(self, name: str, source: str):
+        Path(self._directory.name, f"{name}.py").write_text(source)
+        self.addCleanup(sys.modules.pop, name, None)
+    
+    def test_installed_module_that_fails_to_import(self):
+        # Stands in for an OpenCV build whose DLL is missing.
+        self._write_module("_nexus_broken_backend", "raise ImportError('DLL load failed')\n")
+        self.assertTrue(is_module_available("_nexus_broken_backend"))
+        self.assertFalse(is_module_importable("_nexus_broken_backend"))
+    
+    def test_working_module(self):
+        self._write_module("_nexus_working_backend", "VALUE = 1\n")
+        self.assertTrue(is_module_importable("_nexus_working_backend"))
+        self.assertIn("_nexus_working_backend", sys.modules)
+    
+    def test_missing_module(self):
+        self.assertFalse(is_module_importable("_nexus_missing_backend"))
+
+if __name__ == "__main__":
+    unittest.main()
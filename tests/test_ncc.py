@@ -0,0 +1,65 @@
+"""
+Checks the numba fallback in nexus_autodl.core.ncc against OpenCV.
+"""
+
+import unittest
+
+from nexus_autodl.utils.helpers import is_module_importable
+
+HAS_REFERENCE = all(is_module_importable(name) for name in ("numpy", "cv2", "numba"))
+
+@unittest.skipUnless(HAS_REFERENCE, "numpy, cv2 and numba are required")
+class BestMatchTest(unittest.TestCase):
+    
+    def _frame(self, seed: int, height: int = 120, width: int = 160):
+        import numpy as np
+        rng = np.random.default_rng(seed)
+        # Smooth noise, so neighbouring windows correlate like real UI pixels.
+        noise = rng.integers(0, 256, size=(height // 4, width // 4), dtype=np.uint8)
+        jitter = rng.integers(0, 8, size=(height, width), dtype=np.uint8)
+        return np.kron(noise, np.ones((4, 4), dtype=np.uint8)) + jitter
+    
+    def _reference(self, screen, template):
+        import cv2
+        scores = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, location = cv2.minMaxLoc(scores)
+        return scores, score, location
+    
+    def _best_match(self, screen, template):
+        import numpy as np
+        from nexus_autodl.core.ncc import best_match
+        rows = screen.shape[0] - template.shape[0] + 1
+        cols = screen.shape[1] - template.shape[1] + 1
+        result = np.empty((rows, cols), dtype=np.float32)
+        score, location = best_match(screen, template, result)
+        return result, score, location
+    
+    def test_matches_opencv_peak(self):
+        screen = self._frame(1)
+        for left, top, width, height in ((37, 21, 24, 18), (0, 0, 16, 16), (130, 95, 30, 25)):
+            with self.subTest(box=(left, top, width, height)):
+                template = screen[top:top + height, left:left + width].copy()
+                _, expected_score, expected_location = self._reference(screen, template)
+                _, score, location = self._best_match(screen, template)
+                self.assertEqual(location, expected_location)
+                self.assertEqual(location, (left, top))
+                self.assertAlmostEqual(score, expected_score, places=3)
+    
+    def test_score_map_matches_opencv(self):
+        import numpy as np
+        screen = self._frame(2)
+        template = self._frame(3, 20, 28)
+        expected, _, _ = self._reference(screen, template)
+        result, _, _ = self._best_match(screen, template)
+        np.testing.assert_allclose(result, expected, atol=1e-3)
+    
+    def test_flat_window_scores_zero(self):
+        import numpy as np
+        screen = self._frame(4)
+        screen[40:80, 50:100] = 128
+        template = self._frame(5, 16, 16)
+        result, _, _ = self._best_match(screen, template)
+        self.assertTrue(np.all(result[40:65, 50:85] == 0.0))
+
+if __name__ == "__main__":
+    unittest.main()
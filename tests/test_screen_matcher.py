@@ -0,0 +1,101 @@
+"""
+Checks the coarse-to-fine search in nexus_autodl.core.screen_matcher.
+"""
+
+import unittest
+
+from nexus_autodl.utils.helpers import is_module_importable
+
+HAS_BACKEND = all(is_module_importable(name) for name in ("numpy", "cv2", "PIL"))
+
+@unittest.skipUnless(HAS_BACKEND, "numpy, cv2 and PIL are required")
+class CoarseSearchTest(unittest.TestCase):
+    
+    def _stripes(self, height: int = 28, width: int = 48, period: int = 6):
+        import numpy as np
+        columns = np.where(np.arange(width) // (period // 2) % 2 == 0, 230, 60).astype(np.uint8)
+        stripes = np.repeat(columns[None, :], height, axis=0)
+        stripes[:2] = 60
+        stripes[-2:] = 60
+        return stripes
+    
+    def _frame(self, template, left: int, top: int):
+        import numpy as np
+        frame = np.full((240, 320), 40, dtype=np.uint8)
+        frame[20:60, 20:300] = 90
+        frame[180:220, 40:140] = 150
+        frame[top:top + template.shape[0], left:left + template.shape[1]] = template
+        return frame
+    
+    def test_coarse_miss_falls_back_to_full_resolution(self):
+        from PIL import Image
+        from nexus_autodl.core.screen_matcher import Box, ScreenMatcher, _UNDECIDED
+        
+        # Thin stripes at an odd offset blur into a different pattern once
+        # downsampled, so the coarse level scores the true match poorly.
+        template = self._stripes()
+        matcher = ScreenMatcher()
+        matcher.set_frame(Image.fromarray(self._frame(template, 151, 101)))
+        needle = matcher._as_needle(Image.fromarray(template), True)
+        
+        self.assertGreater(matcher._pyramid_level(needle), 0)
+        self.assertIs(matcher._locate_coarse(matcher._haystack(True), needle, 0.9, None), _UNDECIDED)
+        box = matcher.locate(Image.fromarray(template), True, 0.9, key="stripes")
+        self.assertEqual(box, Box(151, 101, template.shape[1], template.shape[0]))
+    
+    def test_absent_template_is_rejected(self):
+        import numpy as np
+        from PIL import Image
+        from nexus_autodl.core.screen_matcher import ScreenMatcher
+        
+        template = self._stripes()
+        matcher = ScreenMatcher()
+        matcher.set_frame(Image.fromarray(self._frame(np.full_like(template, 40), 151, 101)))
+        self.assertIsNone(matcher.locate(Image.fromarray(template), True, 0.9, key="stripes"))
+    
+    def _colour_frame(self):
+        import numpy as np
+        # The red bar and its backdrop have the same luma, so the template is
+        # nearly flat in grayscale. The decoy above it is identical in gray.
+        luma = round(0.299 * 220 + 0.587 * 40 + 0.114 * 40)
+        template = np.full((32, 48, 3), luma, dtype=np.uint8)
+        template[8:24, 8:40] = (220, 40, 40)
+        decoy = np.full_like(template, luma)
+        frame = np.full((240, 320, 3), 40, dtype=np.uint8)
+        frame[30:62, 100:148] = decoy
+        frame[150:182, 200:248] = template
+        return template, frame
+    
+    def test_colour_template_is_decided_in_colour(self):
+        from PIL import Image
+        from nexus_autodl.core.screen_matcher import Box, ScreenMatcher
+        
+        template, frame = self._colour_frame()
+        matcher = ScreenMatcher()
+        matcher.set_frame(Image.fromarray(frame))
+        box = matcher.locate(Image.fromarray(template), False, 0.9, key="red bar")
+        self.assertEqual(box, Box(200, 150, template.shape[1], template.shape[0]))
+    
+    def test_grayscale_decoy_is_rejected_in_colour(self):
+        from PIL import Image
+        from nexus_autodl.core.screen_matcher import ScreenMatcher
+        
+        template, frame = self._colour_frame()
+        frame[150:182, 200:248] = 40
+        matcher = ScreenMatcher()
+        matcher.set_frame(Image.fromarray(frame))
+        self.assertIsNone(matcher.locate(Image.fromarray(template), False, 0.9, key="red bar"))
+    
+    def test_gray_fallback_conversion_matches_opencv(self):
+        import cv2
+        import numpy as np
+        from nexus_autodl.core.screen_matcher import ScreenMatcher
+        
+        bgr = np.random.default_rng(6).integers(0, 256, size=(64, 64, 3), dtype=np.uint8)
+        gray = ScreenMatcher._as_needle_gray(bgr, True)
+        difference = np.abs(gray.astype(np.int16) - cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY))
+        self.assertLessEqual(int(difference.max()), 1)
+        self.assertLess(float(difference.mean()), 0.05)
+
+if __name__ == "__main__":
+    unittest.main()